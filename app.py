@@ -16,7 +16,7 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import DAT_COMPANIES, PERSONAL_MILESTONES, FRED_API_KEY
+from config import DAT_COMPANIES, DAT_COMPANIES_DF, DAT_BY_TIER, PERSONAL_MILESTONES, fred_api_key
 from components.home import render_home_page
 from components.dat_table import render_dat_table, render_add_dat_form
 from components.dat_detail import render_dat_detail_page, render_dat_selector
@@ -24,7 +24,7 @@ from components.thesis_tracker import render_thesis_tracker, render_thesis_depen
 from components.charts import render_comparison_chart, render_eth_holdings_chart, render_nav_discount_chart
 from components.news_feed import render_news_page, render_news_feed
 from components.other_dats import render_other_dats_page
-from data import fetch_eth_price, fetch_stock_data, calculate_nav_discount, calculate_nav_per_share
+from data import fetch_eth_price, fetch_all_dat_stocks, calculate_nav_discount, calculate_nav_per_share
 from utils import days_until, format_date
 
 # Page configuration
@@ -106,9 +106,10 @@ def render_sidebar() -> str:
         st.caption("✅ CoinGecko")
         st.caption("✅ Yahoo Finance")
         st.caption("✅ DefiLlama")
-        st.caption(f"{'✅' if FRED_API_KEY else '⚠️'} FRED (macro data)")
+        has_fred_key = bool(fred_api_key())
+        st.caption(f"{'✅' if has_fred_key else '⚠️'} FRED (macro data)")
 
-        if not FRED_API_KEY:
+        if not has_fred_key:
             st.caption("Add FRED_API_KEY to .env")
 
     return page
@@ -146,14 +147,15 @@ def render_charts_page() -> None:
     with tab2:
         st.subheader("ETH Holdings Distribution")
 
-        holdings = {ticker: data["eth_holdings"] for ticker, data in DAT_COMPANIES.items()}
+        holdings = DAT_COMPANIES_DF["eth_holdings"].to_dict()
         render_eth_holdings_chart(holdings)
 
         # Tier breakdown
         st.subheader("Holdings by Tier")
 
-        tier1_eth = sum(c["eth_holdings"] for c in DAT_COMPANIES.values() if c["tier"] == 1)
-        tier2_eth = sum(c["eth_holdings"] for c in DAT_COMPANIES.values() if c["tier"] == 2)
+        eth_holdings = DAT_COMPANIES_DF["eth_holdings"]
+        tier1_eth = eth_holdings[list(DAT_BY_TIER.get(1, ()))].sum()
+        tier2_eth = eth_holdings[list(DAT_BY_TIER.get(2, ()))].sum()
 
         col1, col2 = st.columns(2)
         with col1:
@@ -169,8 +171,9 @@ def render_charts_page() -> None:
 
         if eth_price:
             discounts = {}
+            stock_map = fetch_all_dat_stocks(DAT_COMPANIES)
             for ticker, company in DAT_COMPANIES.items():
-                stock = fetch_stock_data(ticker)
+                stock = stock_map[ticker]
                 stock_price = stock.get("price", 0) or 0
                 shares = stock.get("shares_outstanding", 0) or 0
 
@@ -208,8 +208,8 @@ def render_dat_detail_page(ticker: str) -> None:
         st.subheader("Your Position")
 
         position = PERSONAL_POSITIONS[ticker]
-        shares = position.get("shares", 0)
-        cost_basis = position.get("cost_basis")
+        shares = position.shares or 0
+        cost_basis = position.cost_basis
 
         col1, col2, col3 = st.columns(3)
 
@@ -6,10 +6,10 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 from typing import Dict, Any, List
-from config import DAT_COMPANIES
+from config import DAT_COMPANIES, DAT_COMPANIES_DF, DAT_BY_TIER, DEFAULT_DAT_START, ETF_STAKING_YIELD
 from data import (
     fetch_eth_price,
-    fetch_stock_data,
+    fetch_all_dat_stocks,
     fetch_eth_staking_stats,
     calculate_nav,
     calculate_nav_per_share,
@@ -24,57 +24,41 @@ from data import (
 
 def build_dat_dataframe(eth_price: float, staking_apy: float = 0.035) -> pd.DataFrame:
     """Build DataFrame with all DAT company metrics"""
-    rows = []
+    # Config-only metrics are computed column-wise from DAT_COMPANIES_DF
+    eth_holdings = DAT_COMPANIES_DF["eth_holdings"]
+    staking_pct = DAT_COMPANIES_DF["staking_pct"].fillna(0)
+    quarterly_burn_usd = DAT_COMPANIES_DF["quarterly_burn_usd"].fillna(0)
+
+    # Calculate staking yield
+    staked_eth = eth_holdings * staking_pct
+    annual_yield_eth = staked_eth * staking_apy
+    annual_yield_usd = annual_yield_eth * eth_price
+
+    # Calculate burn rate
+    annual_burn_usd = quarterly_burn_usd * 4
+    if eth_price > 0:
+        annual_burn_eth = annual_burn_usd / eth_price
+    else:
+        annual_burn_eth = pd.Series(0.0, index=DAT_COMPANIES_DF.index)
 
-    for ticker, company in DAT_COMPANIES.items():
-        # Fetch stock data
-        stock = fetch_stock_data(ticker)
+    # Stock-dependent metrics need one fetch per ticker, run concurrently
+    stock_map = fetch_all_dat_stocks(eth_holdings.index)
+    stock_rows = []
+    for ticker, holdings in eth_holdings.items():
+        stock = stock_map[ticker]
 
-        eth_holdings = company["eth_holdings"]
-        staking_pct = company.get("staking_pct", 0)
-        staking_method = company.get("staking_method", "N/A")
-        quarterly_burn_usd = company.get("quarterly_burn_usd", 0)
-        burn_source = company.get("burn_source", "")
         stock_price = stock.get("price", 0) or 0
         shares_outstanding = stock.get("shares_outstanding", 0) or 0
         market_cap = stock.get("market_cap", 0) or 0
 
         # Calculate metrics
-        nav = calculate_nav(eth_holdings, eth_price)
-        nav_per_share = calculate_nav_per_share(eth_holdings, eth_price, shares_outstanding)
+        nav = calculate_nav(holdings, eth_price)
+        nav_per_share = calculate_nav_per_share(holdings, eth_price, shares_outstanding)
         nav_discount = calculate_nav_discount(stock_price, nav_per_share) if nav_per_share else None
-        eth_per_share = calculate_eth_per_share(eth_holdings, shares_outstanding)
+        eth_per_share = calculate_eth_per_share(holdings, shares_outstanding)
         phase, phase_desc = determine_dat_phase(nav_discount, False, stock.get("pe_ratio"), None)
 
-        # Calculate staking yield
-        staked_eth = eth_holdings * staking_pct
-        annual_yield_eth = staked_eth * staking_apy
-        annual_yield_usd = annual_yield_eth * eth_price
-
-        # Calculate burn rate
-        annual_burn_usd = quarterly_burn_usd * 4
-        annual_burn_eth = annual_burn_usd / eth_price if eth_price > 0 else 0
-
-        # Net productivity = yield - burn
-        net_annual_eth = annual_yield_eth - annual_burn_eth
-        net_annual_usd = annual_yield_usd - annual_burn_usd
-
-        rows.append({
-            "Ticker": ticker,
-            "Company": company["name"],
-            "Tier": company["tier"],
-            "ETH Holdings": eth_holdings,
-            "Staked %": staking_pct,
-            "Staked ETH": staked_eth,
-            "Staking Method": staking_method,
-            "Annual Yield ETH": annual_yield_eth,
-            "Annual Yield USD": annual_yield_usd,
-            "Quarterly Burn USD": quarterly_burn_usd,
-            "Annual Burn USD": annual_burn_usd,
-            "Annual Burn ETH": annual_burn_eth,
-            "Burn Source": burn_source,
-            "Net Annual ETH": net_annual_eth,
-            "Net Annual USD": net_annual_usd,
+        stock_rows.append({
             "Treasury Value": nav,
             "Stock Price": stock_price,
             "Market Cap": market_cap,
@@ -82,10 +66,32 @@ def build_dat_dataframe(eth_price: float, staking_apy: float = 0.035) -> pd.Data
             "NAV Discount": nav_discount,
             "ETH/Share": eth_per_share,
             "Phase": phase,
-            "Leader": company["leader"],
         })
 
-    return pd.DataFrame(rows)
+    stock_df = pd.DataFrame(stock_rows, index=DAT_COMPANIES_DF.index)
+
+    df = pd.DataFrame({
+        "Ticker": DAT_COMPANIES_DF.index,
+        "Company": DAT_COMPANIES_DF["name"],
+        "Tier": DAT_COMPANIES_DF["tier"],
+        "ETH Holdings": eth_holdings,
+        "Staked %": staking_pct,
+        "Staked ETH": staked_eth,
+        "Staking Method": DAT_COMPANIES_DF["staking_method"].fillna("N/A"),
+        "Annual Yield ETH": annual_yield_eth,
+        "Annual Yield USD": annual_yield_usd,
+        "Quarterly Burn USD": quarterly_burn_usd,
+        "Annual Burn USD": annual_burn_usd,
+        "Annual Burn ETH": annual_burn_eth,
+        "Burn Source": DAT_COMPANIES_DF["burn_source"].fillna(""),
+        # Net productivity = yield - burn
+        "Net Annual ETH": annual_yield_eth - annual_burn_eth,
+        "Net Annual USD": annual_yield_usd - annual_burn_usd,
+        **stock_df,
+        "Leader": DAT_COMPANIES_DF["leader"],
+    })
+
+    return df.reset_index(drop=True)
 
 
 def render_dat_table() -> None:
@@ -203,35 +209,40 @@ def render_dat_table() -> None:
     st.markdown("---")
     st.subheader("By Tier")
 
-    tier1 = df[df["Tier"] == 1]
-    tier2 = df[df["Tier"] == 2]
+    # Holdings come straight from config, so use the precomputed tier index
+    eth_holdings = DAT_COMPANIES_DF["eth_holdings"]
+    tier1 = eth_holdings[list(DAT_BY_TIER.get(1, ()))]
+    tier2 = eth_holdings[list(DAT_BY_TIER.get(2, ()))]
 
     col1, col2 = st.columns(2)
 
     with col1:
         st.markdown("**Tier 1 (>100k ETH)**")
-        st.caption(f"{len(tier1)} companies | {format_eth_amount(tier1['ETH Holdings'].sum())}")
-        for _, row in tier1.iterrows():
-            st.caption(f"• {row['Ticker']}: {format_eth_amount(row['ETH Holdings'])}")
+        st.caption(f"{len(tier1)} companies | {format_eth_amount(tier1.sum())}")
+        for ticker, holdings in tier1.items():
+            st.caption(f"• {ticker}: {format_eth_amount(holdings)}")
 
     with col2:
         st.markdown("**Tier 2 (10k-100k ETH)**")
-        st.caption(f"{len(tier2)} companies | {format_eth_amount(tier2['ETH Holdings'].sum())}")
-        for _, row in tier2.iterrows():
-            st.caption(f"• {row['Ticker']}: {format_eth_amount(row['ETH Holdings'])}")
+        st.caption(f"{len(tier2)} companies | {format_eth_amount(tier2.sum())}")
+        for ticker, holdings in tier2.items():
+            st.caption(f"• {ticker}: {format_eth_amount(holdings)}")
 
     # Company Productivity Section
     st.markdown("---")
     st.subheader("Company Productivity: Yield vs Burn")
 
-    from config import ETF_STAKING_YIELD
     st.caption(f"Network staking: {staking_apy*100:.2f}% APY | ETF staking: {ETF_STAKING_YIELD*100:.1f}% APY (after fees)")
 
     # Build productivity table
     productivity_data = []
     today = datetime.now()
 
-    for _, row in df.iterrows():
+    records = df[[
+        "Ticker", "ETH Holdings", "Annual Yield ETH", "Annual Burn ETH", "Quarterly Burn USD", "Staked %"
+    ]].to_dict("records")
+
+    for row in records:
         ticker = row["Ticker"]
         company_config = DAT_COMPANIES.get(ticker, {})
 
@@ -244,8 +255,9 @@ def render_dat_table() -> None:
         eth_from_premium = company_config.get("eth_from_premium", 0)
 
         # Calculate months active to annualize premium
-        dat_start_str = company_config.get("dat_start_date", "2024-01-01")
-        dat_start = datetime.strptime(dat_start_str, "%Y-%m-%d")
+        dat_start = datetime.combine(
+            company_config.get("dat_start_date", DEFAULT_DAT_START), datetime.min.time()
+        )
         months_active = max(1, (today - dat_start).days / 30.44)  # Avg days per month
         years_active = months_active / 12
 
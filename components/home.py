@@ -7,10 +7,12 @@ from datetime import datetime
 from typing import Dict, Any
 from config import (
     DAT_COMPANIES,
+    DAT_COMPANIES_DF,
     PERSONAL_POSITIONS,
+    Health,
     HEALTH_STATUS,
     INVALIDATION_THRESHOLDS,
-    FRED_API_KEY,
+    fred_api_key,
 )
 from data import (
     fetch_eth_price,
@@ -29,10 +31,10 @@ from data import (
 from validation import get_data_health_summary
 
 
-def render_health_indicator(status: str, label: str) -> None:
+def render_health_indicator(status: Health, label: str) -> None:
     """Render a health status indicator"""
-    config = HEALTH_STATUS.get(status, HEALTH_STATUS["unknown"])
-    st.markdown(f"{config['emoji']} **{label}**")
+    style = HEALTH_STATUS[status]
+    st.markdown(f"{style.emoji} **{label}**")
 
 
 def render_precondition_health() -> None:
@@ -48,8 +50,9 @@ def render_precondition_health() -> None:
 
     # Fetch macro data from FRED
     deficit_gdp = None
-    if FRED_API_KEY:
-        deficit_data = fetch_deficit_gdp_ratio(FRED_API_KEY)
+    fred_key = fred_api_key()
+    if fred_key:
+        deficit_data = fetch_deficit_gdp_ratio(fred_key)
         deficit_gdp = deficit_data.get("value") if "error" not in deficit_data else None
 
     # Check health
@@ -64,35 +67,35 @@ def render_precondition_health() -> None:
     with col1:
         status = health["eth_dominance"]["status"]
         label = health["eth_dominance"]["label"]
-        config = HEALTH_STATUS.get(status, HEALTH_STATUS["unknown"])
+        style = HEALTH_STATUS[status]
         st.metric(
             label="ETH Dominance",
-            value=config["emoji"],
+            value=style.emoji,
             delta=label,
         )
-        if status == "critical":
+        if status == Health.CRITICAL:
             st.caption("⚠️ " + health["eth_dominance"].get("threshold", ""))
 
     with col2:
         status = health["eth_yield"]["status"]
         label = health["eth_yield"]["label"]
-        config = HEALTH_STATUS.get(status, HEALTH_STATUS["unknown"])
+        style = HEALTH_STATUS[status]
         st.metric(
             label="ETH Yield",
-            value=config["emoji"],
+            value=style.emoji,
             delta=label,
         )
 
     with col3:
         status = health["macro_backdrop"]["status"]
         label = health["macro_backdrop"]["label"]
-        config = HEALTH_STATUS.get(status, HEALTH_STATUS["unknown"])
+        style = HEALTH_STATUS[status]
         st.metric(
             label="Macro Backdrop",
-            value=config["emoji"],
+            value=style.emoji,
             delta=label,
         )
-        if status == "unknown":
+        if status == Health.UNKNOWN:
             st.caption("Add FRED API key for macro data")
 
 
@@ -164,7 +167,7 @@ def render_position_health() -> None:
         bmnr_drawdown = bmnr.get("drawdown")
         bmnr_price = bmnr.get("price", 0)
         st.metric(
-            label=f"BMNR ({PERSONAL_POSITIONS['BMNR']['shares']:,} shares)",
+            label=f"BMNR ({PERSONAL_POSITIONS['BMNR'].shares:,} shares)",
             value=format_large_number(bmnr_value) if bmnr_price else "N/A",
             delta=format_percentage(bmnr_drawdown) if bmnr_drawdown else None,
             delta_color="inverse" if bmnr_drawdown and bmnr_drawdown < 0 else "normal",
@@ -176,7 +179,7 @@ def render_position_health() -> None:
         sbet_drawdown = sbet.get("drawdown")
         sbet_price = sbet.get("price", 0)
         st.metric(
-            label=f"SBET ({PERSONAL_POSITIONS['SBET']['shares']:,} shares)",
+            label=f"SBET ({PERSONAL_POSITIONS['SBET'].shares:,} shares)",
             value=format_large_number(sbet_value) if sbet_price else "N/A",
             delta=format_percentage(sbet_drawdown) if sbet_drawdown else None,
             delta_color="inverse" if sbet_drawdown and sbet_drawdown < 0 else "normal",
@@ -299,7 +302,7 @@ def render_home_page() -> None:
         st.metric("ETH Price", f"${eth_price:,.2f}" if eth_price else "N/A")
     with col2:
         # Total DAT ETH holdings
-        total_eth = sum(c["eth_holdings"] for c in DAT_COMPANIES.values())
+        total_eth = DAT_COMPANIES_DF["eth_holdings"].sum()
         total_value = total_eth * eth_price if eth_price else 0
         st.metric("DAT Universe Value", format_large_number(total_value))
     with col3:
@@ -3,94 +3,207 @@ Other DAT Universe Component
 Displays SOL, HYPE, and BNB treasury companies (for tracking/news only)
 """
 import streamlit as st
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
-from config import SOL_DAT_COMPANIES, HYPE_DAT_COMPANIES, BNB_DAT_COMPANIES, BTC_DAT_COMPANIES
-from data import fetch_stock_data
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+from config import SOL_DAT_COMPANIES, HYPE_DAT_COMPANIES, BNB_DAT_COMPANIES, BTC_DAT_COMPANIES, DEFAULT_DAT_START
+from data import fetch_all_dat_stocks, get_http_session
+from data.fetchers import json_parser
+
+# CoinGecko IDs
+COINGECKO_IDS = {
+    "BTC": "bitcoin",
+    "SOL": "solana",
+    "HYPE": "hyperliquid",
+    "BNB": "binancecoin",
+}
+
+# Fallback prices when CoinGecko is unavailable
+FALLBACK_PRICES = {"BTC": 95000.0, "SOL": 125.0, "HYPE": 25.0, "BNB": 700.0}
+
+# Company definitions per asset (lets cached functions key on the asset name)
+ASSET_COMPANIES = {
+    "BTC": BTC_DAT_COMPANIES,
+    "SOL": SOL_DAT_COMPANIES,
+    "HYPE": HYPE_DAT_COMPANIES,
+    "BNB": BNB_DAT_COMPANIES,
+}
+
+# Total holdings per asset - config is static, so sum once at import
+ASSET_TOTALS = {
+    asset: sum(c["holdings"] for c in companies.values())
+    for asset, companies in ASSET_COMPANIES.items()
+}
+
+
+def _build_config_frames(asset: str, companies: Dict[str, Any]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Split a company config dict into (raw, numeric, text) columnar frames"""
+    config_df = pd.DataFrame.from_dict(companies, orient="index")
+    numeric = (
+        config_df.reindex(columns=[
+            "holdings", "cost_basis_avg", "staking_pct", "staking_apy", "quarterly_burn_usd",
+            "btc_mined_annual", "btc_acquired_2025", f"{asset.lower()}_from_premium",
+        ])
+        .apply(pd.to_numeric, errors="coerce")
+        .fillna(0)
+    )
+    text = config_df.reindex(columns=["leader", "strategy", "notes"]).fillna("")
+    return config_df, numeric, text
 
 
-def get_asset_price(asset: str) -> float:
-    """Fetch current price for BTC, SOL, HYPE, or BNB"""
-    # Using CoinGecko IDs
-    asset_ids = {
-        "BTC": "bitcoin",
-        "SOL": "solana",
-        "HYPE": "hyperliquid",
-        "BNB": "binancecoin",
-    }
+# Columnar views of the static company config, built once at import
+ASSET_CONFIG_FRAMES = {
+    asset: _build_config_frames(asset, companies)
+    for asset, companies in ASSET_COMPANIES.items()
+    if companies
+}
 
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_live_asset_prices(assets: Tuple[str, ...]) -> Dict[str, float]:
+    """Fetch current prices for several assets in a single CoinGecko request
+
+    Raises on failure - st.cache_data doesn't cache exceptions, so the next
+    rerun retries instead of serving fallback prices for the whole TTL.
+    """
+    cg_ids = {asset: COINGECKO_IDS[asset] for asset in assets if asset in COINGECKO_IDS}
+    prices = {asset: 0 for asset in assets}
+
+    if cg_ids:
+        url = (
+            "https://api.coingecko.com/api/v3/simple/price"
+            f"?ids={','.join(cg_ids.values())}&vs_currencies=usd"
+        )
+        response = get_http_session().get(url, timeout=10)
+        response.raise_for_status()
+        data = json_parser.loads(response.content)
+        for asset, cg_id in cg_ids.items():
+            prices[asset] = data.get(cg_id, {}).get("usd", 0)
+
+    return prices
+
+
+def get_asset_prices(assets: Tuple[str, ...]) -> Dict[str, float]:
+    """Current prices for several assets, falling back to FALLBACK_PRICES if CoinGecko fails"""
     try:
-        import requests
-        cg_id = asset_ids.get(asset)
-        if not cg_id:
-            return 0
-
-        url = f"https://api.coingecko.com/api/v3/simple/price?ids={cg_id}&vs_currencies=usd"
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get(cg_id, {}).get("usd", 0)
+        return fetch_live_asset_prices(assets)
     except Exception:
-        pass
+        return {
+            asset: FALLBACK_PRICES.get(asset, 0) if asset in COINGECKO_IDS else 0
+            for asset in assets
+        }
+
 
-    # Fallback prices
-    fallback = {"BTC": 95000.0, "SOL": 125.0, "HYPE": 25.0, "BNB": 700.0}
-    return fallback.get(asset, 0)
+def get_asset_price(asset: str) -> float:
+    """Fetch current price for BTC, SOL, HYPE, or BNB"""
+    return get_asset_prices((asset,))[asset]
 
 
-def build_dat_dataframe(companies: Dict[str, Any], asset_price: float) -> pd.DataFrame:
+@st.cache_data(ttl=300, show_spinner=False)
+def build_dat_dataframe(asset: str, asset_price: float) -> pd.DataFrame:
     """Build DataFrame with DAT company metrics"""
-    rows = []
-
-    for ticker, company in companies.items():
-        holdings = company.get("holdings", 0)
-        cost_basis = company.get("cost_basis_avg", 0)
-        staking_pct = company.get("staking_pct", 0)
-        staking_apy = company.get("staking_apy", 0)
-
-        # Calculate values
-        treasury_value = holdings * asset_price
-        cost_value = holdings * cost_basis
-        unrealized_pnl = treasury_value - cost_value
-        pnl_pct = (unrealized_pnl / cost_value * 100) if cost_value > 0 else 0
-
-        # Annual yield from staking
-        staked_holdings = holdings * staking_pct
-        annual_yield = staked_holdings * staking_apy
-        annual_yield_usd = annual_yield * asset_price
-
-        # Fetch stock data for market cap
-        stock = fetch_stock_data(ticker)
-        stock_price = stock.get("price", 0) or 0
-        market_cap = stock.get("market_cap", 0) or 0
-
-        # mNAV = Market Cap / NAV (treasury value)
-        mnav = market_cap / treasury_value if treasury_value > 0 else 0
-
-        rows.append({
-            "Ticker": ticker,
-            "Company": company["name"],
-            "Tier": company["tier"],
-            "Holdings": holdings,
-            "Treasury Value": treasury_value,
-            "Cost Basis": cost_value,
-            "Unrealized P&L": unrealized_pnl,
-            "P&L %": pnl_pct,
-            "Staked %": staking_pct,
-            "Staking APY": staking_apy,
-            "Annual Yield": annual_yield,
-            "Annual Yield USD": annual_yield_usd,
-            "Stock Price": stock_price,
-            "Market Cap": market_cap,
-            "mNAV": mnav,
-            "Leader": company.get("leader", ""),
-            "Strategy": company.get("strategy", ""),
-            "Notes": company.get("notes", ""),
-        })
+    companies = ASSET_COMPANIES.get(asset, {})
+    if not companies:
+        return pd.DataFrame()
+
+    stock_map = fetch_all_dat_stocks(companies)
+
+    # One column per config field, one row per ticker
+    config_df, numeric, text = ASSET_CONFIG_FRAMES[asset]
+    premium_field = f"{asset.lower()}_from_premium"
+    stock = (
+        pd.DataFrame.from_dict(stock_map, orient="index")
+        .reindex(index=config_df.index, columns=["price", "market_cap"])
+        .apply(pd.to_numeric, errors="coerce")
+        .fillna(0)
+    )
+
+    holdings = numeric["holdings"]
+
+    # Calculate values
+    treasury_value = holdings * asset_price
+    cost_value = holdings * numeric["cost_basis_avg"]
+    unrealized_pnl = treasury_value - cost_value
+    pnl_pct = (unrealized_pnl / cost_value.where(cost_value > 0) * 100).fillna(0)
+
+    # Annual yield from staking
+    annual_yield = holdings * numeric["staking_pct"] * numeric["staking_apy"]
+    annual_yield_usd = annual_yield * asset_price
+
+    # mNAV = Market Cap / NAV (treasury value)
+    mnav = (stock["market_cap"] / treasury_value.where(treasury_value > 0)).fillna(0)
+
+    # Annual burn in tokens
+    annual_burn_usd = numeric["quarterly_burn_usd"] * 4
+    if asset_price > 0:
+        annual_burn = annual_burn_usd / asset_price
+    else:
+        annual_burn = pd.Series(0.0, index=config_df.index)
 
-    return pd.DataFrame(rows)
+    # Premium capture - annualized based on company age
+    dat_start = pd.to_datetime(
+        config_df.reindex(columns=["dat_start_date"])["dat_start_date"].fillna(DEFAULT_DAT_START)
+    )
+    months_active = ((pd.Timestamp.now() - dat_start).dt.days / 30.44).clip(lower=1)
+    years_active = (months_active / 12).fillna(1.0)
+    annualized_premium = numeric[premium_field] / years_active
 
+    if asset == "BTC":
+        # BTC: Use actual 2025 acquisition rate (already net of sales)
+        # Burn is already reflected in reduced acquisition ability
+        total_tokens = numeric["btc_acquired_2025"]
+    else:
+        # PoS: Yield + Premium - Burn
+        total_tokens = annual_yield + annualized_premium - annual_burn
 
+    # Net rate (as % of holdings)
+    net_rate = (total_tokens / holdings.where(holdings > 0)).fillna(0)
+
+    if asset == "BTC":
+        # For BTC, compare to 0% (no native yield)
+        yield_multiple = total_tokens.gt(0).map({True: float("inf"), False: 0.0})
+    else:
+        staking_apy = numeric["staking_apy"]
+        yield_multiple = (net_rate / staking_apy.where(staking_apy > 0)).fillna(0)
+
+    df = pd.DataFrame({
+        "Ticker": config_df.index,
+        "Company": config_df["name"],
+        "Tier": config_df["tier"],
+        "Holdings": holdings,
+        "Treasury Value": treasury_value,
+        "Cost Basis": cost_value,
+        "Unrealized P&L": unrealized_pnl,
+        "P&L %": pnl_pct,
+        "Staked %": numeric["staking_pct"],
+        "Staking APY": numeric["staking_apy"],
+        "Annual Yield": annual_yield,
+        "Annual Yield USD": annual_yield_usd,
+        "Stock Price": stock["price"],
+        "Market Cap": stock["market_cap"],
+        "mNAV": mnav,
+        "Leader": text["leader"],
+        "Strategy": text["strategy"],
+        "Notes": text["notes"],
+        # Productivity: Yield + Premium - Burn
+        "Is Miner": config_df.reindex(columns=["is_miner"])["is_miner"].fillna(False).astype(bool),
+        "Mining Annual": numeric["btc_mined_annual"],
+        "Net Acquired 2025": numeric["btc_acquired_2025"],
+        "Annual Burn USD": annual_burn_usd,
+        "Annual Burn": annual_burn,
+        "Annualized Premium": annualized_premium,
+        "Total Tokens": total_tokens,
+        "Total USD": total_tokens * asset_price,
+        "Net Rate": net_rate,
+        "Yield Multiple": yield_multiple,
+        "Accretive": total_tokens > 0,
+    })
+
+    return df.reset_index(drop=True)
+
+
+@lru_cache(maxsize=256)
 def format_large_number(num: float) -> str:
     """Format large numbers with B/M suffix"""
     if num >= 1e9:
@@ -103,99 +216,116 @@ def format_large_number(num: float) -> str:
         return f"${num:.0f}"
 
 
-def render_asset_section(asset: str, companies: Dict[str, Any], asset_price: float) -> None:
-    """Render a section for a specific asset type"""
-    if not companies:
-        st.caption(f"No {asset} treasury companies configured")
-        return
+def format_count_vec(values: pd.Series, signed: bool = False) -> np.ndarray:
+    """Format a column of token/share counts with thousands separators"""
+    out = values.map("{:,.0f}".format).to_numpy(dtype=str)
+    if signed:
+        out = np.char.add(np.where(values.to_numpy(dtype=float) >= 0, "+", ""), out)
+    return out
 
-    st.caption(f"{asset} Price: ${asset_price:,.2f}")
 
-    df = build_dat_dataframe(companies, asset_price)
-    is_btc = asset == "BTC"
+def format_pct_vec(values: pd.Series, decimals: int = 1, signed: bool = False) -> np.ndarray:
+    """Format a column of fractions as percentages (0.123 -> 12.3%)"""
+    arr = values.to_numpy(dtype=float)
+    out = np.char.mod(f"%.{decimals}f%%", arr * 100)
+    if signed:
+        out = np.char.add(np.where(arr >= 0, "+", ""), out)
+    return out
 
-    # Format for display
-    display_df = df.copy()
-    display_df["Holdings"] = display_df["Holdings"].apply(lambda x: f"{x:,.0f}")
-    display_df["Treasury Value"] = display_df["Treasury Value"].apply(format_large_number)
-    display_df["Unrealized P&L"] = display_df["Unrealized P&L"].apply(
-        lambda x: f"+{format_large_number(x)}" if x >= 0 else f"-{format_large_number(abs(x))}"
-    )
-    display_df["P&L %"] = display_df["P&L %"].apply(
-        lambda x: f"+{x:.1f}%" if x >= 0 else f"{x:.1f}%"
-    )
-    display_df["Stock Price"] = display_df["Stock Price"].apply(
-        lambda x: f"${x:.2f}" if x else "N/A"
-    )
-    display_df["Market Cap"] = display_df["Market Cap"].apply(
-        lambda x: format_large_number(x) if x else "N/A"
-    )
+
+# Display formats for the asset table - applied by Styler so columns stay numeric
+ASSET_TABLE_FORMAT = {
+    "Holdings": "{:,.0f}",
+    "Treasury Value": format_large_number,
+    "Market Cap": lambda x: format_large_number(x) if x else "N/A",
+    "mNAV": lambda x: f"{x:.2f}x" if x else "N/A",
+    "Stock Price": lambda x: f"${x:.2f}" if x else "N/A",
+    "Staked %": "{:.0%}",
+    "Staking APY": "{:.1%}",
+}
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _make_display_df(asset: str, asset_price: float) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, float]]:
+    """Build the company table, the details table, and summary totals for an asset"""
+    df = build_dat_dataframe(asset, asset_price)
 
     # Display columns - BTC has no staking
-    if is_btc:
-        display_df["mNAV"] = display_df["mNAV"].apply(lambda x: f"{x:.2f}x" if x else "N/A")
+    if asset == "BTC":
         columns_to_show = [
             "Ticker", "Company", "Holdings", "Treasury Value",
             "Market Cap", "mNAV", "Stock Price"
         ]
     else:
-        display_df["Staked %"] = display_df["Staked %"].apply(lambda x: f"{x*100:.0f}%")
-        display_df["Staking APY"] = display_df["Staking APY"].apply(lambda x: f"{x*100:.1f}%")
-        display_df["Annual Yield"] = display_df["Annual Yield"].apply(lambda x: f"{x:,.0f}")
-        display_df["mNAV"] = display_df["mNAV"].apply(lambda x: f"{x:.2f}x" if x else "N/A")
         columns_to_show = [
             "Ticker", "Company", "Holdings", "Treasury Value",
             "Market Cap", "mNAV", "Staked %", "Staking APY"
         ]
 
+    # Summary stats
+    total_value = df["Treasury Value"].sum()
+    total_market_cap = df["Market Cap"].sum()
+    totals = {
+        "holdings": df["Holdings"].sum(),
+        "value": total_value,
+        "market_cap": total_market_cap,
+        # Aggregate mNAV = Total Market Cap / Total NAV
+        "mnav": total_market_cap / total_value if total_value > 0 else 0,
+        "yield": df["Annual Yield"].sum(),
+    }
+
+    details_df = df[["Ticker", "Company", "Strategy", "Leader", "Notes"]]
+    return df[columns_to_show], details_df, totals
+
+
+def render_asset_section(asset: str, companies: Dict[str, Any], asset_price: float) -> None:
+    """Render a section for a specific asset type"""
+    if not companies:
+        st.caption(f"No {asset} treasury companies configured")
+        return
+
+    st.caption(f"{asset} Price: ${asset_price:,.2f}")
+
+    display_df, details_df, totals = _make_display_df(asset, asset_price)
+
+    formats = {col: fmt for col, fmt in ASSET_TABLE_FORMAT.items() if col in display_df.columns}
     st.dataframe(
-        display_df[columns_to_show],
+        display_df.style.format(formats),
         use_container_width=True,
         hide_index=True,
     )
 
-    # Summary stats
-    total_holdings = df["Holdings"].sum()
-    total_value = df["Treasury Value"].sum()
-    total_pnl = df["Unrealized P&L"].sum()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric(f"Total {asset}", f"{totals['holdings']:,.0f}")
+    with col2:
+        st.metric("Treasury Value", format_large_number(totals["value"]))
 
-    if is_btc:
+    if asset == "BTC":
         # BTC: Show mNAV metrics
-        total_market_cap = df["Market Cap"].sum()
-        # Aggregate mNAV = Total Market Cap / Total NAV
-        agg_mnav = total_market_cap / total_value if total_value > 0 else 0
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric(f"Total {asset}", f"{total_holdings:,.0f}")
-        with col2:
-            st.metric("Treasury Value", format_large_number(total_value))
         with col3:
-            st.metric("Market Cap", format_large_number(total_market_cap))
+            st.metric("Market Cap", format_large_number(totals["market_cap"]))
         with col4:
-            st.metric("Aggregate mNAV", f"{agg_mnav:.2f}x")
+            st.metric("Aggregate mNAV", f"{totals['mnav']:.2f}x")
     else:
         # PoS chains: Show staking yield + mNAV
-        total_market_cap = df["Market Cap"].sum()
-        agg_mnav = total_market_cap / total_value if total_value > 0 else 0
-        total_yield = df["Annual Yield"].sum()
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric(f"Total {asset}", f"{total_holdings:,.0f}")
-        with col2:
-            st.metric("Treasury Value", format_large_number(total_value))
         with col3:
-            st.metric("Aggregate mNAV", f"{agg_mnav:.2f}x")
+            st.metric("Aggregate mNAV", f"{totals['mnav']:.2f}x")
         with col4:
-            st.metric(f"Annual Yield", f"{total_yield:,.0f} {asset}")
+            st.metric(f"Annual Yield", f"{totals['yield']:,.0f} {asset}")
 
     # Expandable details for each company
     with st.expander("Company Details"):
-        for _, row in df.iterrows():
-            st.markdown(f"**{row['Ticker']} - {row['Company']}**")
-            st.caption(f"Strategy: {row['Strategy']}")
-            st.caption(f"Leader: {row['Leader']}")
-            st.caption(f"Notes: {row['Notes']}")
-            st.markdown("---")
+        st.dataframe(
+            details_df,
+            use_container_width=True,
+            hide_index=True,
+        )
+
+
+def has_holdings(asset: str) -> bool:
+    """Check whether any company in a category reports non-zero holdings"""
+    return ASSET_TOTALS.get(asset, 0) > 0
 
 
 def render_productivity_section(asset: str, companies: Dict[str, Any], asset_price: float) -> None:
@@ -206,111 +336,34 @@ def render_productivity_section(asset: str, companies: Dict[str, Any], asset_pri
     - PoS chains: Yield = Staking rewards
     - All: Premium = Annualized premium capture from share issuance
     """
-    from datetime import datetime
-
-    if not companies or asset_price <= 0:
+    if not companies or asset_price <= 0 or not has_holdings(asset):
         return
 
     is_btc = asset == "BTC"
     yield_source = "Mining" if is_btc else "Staking"
     st.subheader(f"{asset} Company Productivity: {yield_source} + Premium vs Burn")
 
-    productivity_data = []
-    today = datetime.now()
-
-    # Get the correct premium field name for this asset
-    premium_field = f"{asset.lower()}_from_premium"
-    if asset == "BTC":
-        premium_field = "btc_from_premium"
-
-    for ticker, company in companies.items():
-        holdings = company.get("holdings", 0)
-        quarterly_burn_usd = company.get("quarterly_burn_usd", 0)
-
-        # Yield calculation depends on asset type
-        if is_btc:
-            # BTC: Use actual 2025 acquisition rate (more accurate than premium calc)
-            # This captures mining + purchases - sales = net BTC added
-            annual_acquired = company.get("btc_acquired_2025", 0)
-            annual_yield_tokens = company.get("btc_mined_annual", 0)  # For display only
-            is_miner = company.get("is_miner", False)
-        else:
-            # PoS chains: Yield = Staking rewards + Annualized premium
-            staking_pct = company.get("staking_pct", 0)
-            staking_apy = company.get("staking_apy", 0)
-            staked_holdings = holdings * staking_pct
-            annual_yield_tokens = staked_holdings * staking_apy
-            is_miner = False
-
-            # Premium capture - annualized based on company age
-            from_premium = company.get(premium_field, 0)
-            dat_start_str = company.get("dat_start_date", "2024-01-01")
-            try:
-                dat_start = datetime.strptime(dat_start_str, "%Y-%m-%d")
-                months_active = max(1, (today - dat_start).days / 30.44)
-                years_active = months_active / 12
-            except:
-                years_active = 1.0
-            annualized_premium = from_premium / years_active if years_active > 0 else 0
-            annual_acquired = annual_yield_tokens + annualized_premium
-
-        annual_yield_usd = annual_yield_tokens * asset_price
-
-        # Annual burn in tokens
-        annual_burn_usd = quarterly_burn_usd * 4
-        annual_burn_tokens = annual_burn_usd / asset_price if asset_price > 0 else 0
-
-        # Total productivity
-        if is_btc:
-            # BTC: Use actual acquisition rate (already net of sales)
-            # Burn is already reflected in reduced acquisition ability
-            total_tokens = annual_acquired
-        else:
-            # PoS: Yield + Premium - Burn
-            total_tokens = annual_acquired - annual_burn_tokens
-
-        total_usd = total_tokens * asset_price
-
-        # Net rate (as % of holdings)
-        net_rate = (total_tokens / holdings) if holdings > 0 else 0
-
-        # Yield multiple depends on asset type
-        if is_btc:
-            # For BTC, compare to 0% (no native yield)
-            yield_multiple = float('inf') if total_tokens > 0 else 0
-        else:
-            staking_apy = company.get("staking_apy", 0)
-            yield_multiple = net_rate / staking_apy if staking_apy > 0 else 0
-
-        # Is accretive?
-        is_accretive = total_tokens > 0
-
-        if is_btc:
-            productivity_data.append({
-                "Ticker": ticker,
-                "Holdings": holdings,
-                "Is Miner": is_miner,
-                "Mining (BTC/yr)": annual_yield_tokens,
-                "Burn (BTC/yr)": annual_burn_tokens,
-                "Net Acquired 2025": annual_acquired,
-                "Net Rate": net_rate,
-                "Accretive": is_accretive,
-            })
-        else:
-            productivity_data.append({
-                "Ticker": ticker,
-                "Holdings": holdings,
-                f"Yield ({asset}/yr)": annual_yield_tokens,
-                f"Premium ({asset}/yr)": annualized_premium,
-                f"Burn ({asset}/yr)": annual_burn_tokens,
-                f"Total ({asset}/yr)": total_tokens,
-                "Total (USD/yr)": total_usd,
-                "Net Rate": net_rate,
-                "Yield Multiple": yield_multiple,
-                "Accretive": is_accretive,
-            })
-
-    prod_df = pd.DataFrame(productivity_data)
+    # Productivity columns are computed alongside the company metrics
+    df = build_dat_dataframe(asset, asset_price)
+    if is_btc:
+        prod_df = df[[
+            "Ticker", "Holdings", "Is Miner", "Mining Annual", "Annual Burn",
+            "Net Acquired 2025", "Net Rate", "Accretive",
+        ]].rename(columns={
+            "Mining Annual": "Mining (BTC/yr)",
+            "Annual Burn": "Burn (BTC/yr)",
+        })
+    else:
+        prod_df = df[[
+            "Ticker", "Holdings", "Annual Yield", "Annualized Premium", "Annual Burn",
+            "Total Tokens", "Total USD", "Net Rate", "Yield Multiple", "Accretive",
+        ]].rename(columns={
+            "Annual Yield": f"Yield ({asset}/yr)",
+            "Annualized Premium": f"Premium ({asset}/yr)",
+            "Annual Burn": f"Burn ({asset}/yr)",
+            "Total Tokens": f"Total ({asset}/yr)",
+            "Total USD": "Total (USD/yr)",
+        })
 
     # Sort by appropriate column
     if is_btc:
@@ -318,44 +371,37 @@ def render_productivity_section(asset: str, companies: Dict[str, Any], asset_pri
     else:
         prod_df = prod_df.sort_values(f"Total ({asset}/yr)", ascending=False)
 
+    # Column totals for the summary metrics, in one pass over the numeric frame
+    totals = prod_df.drop(columns="Ticker").sum()
+
     # Format for display
     display_prod = prod_df.copy()
-    display_prod["Holdings"] = display_prod["Holdings"].apply(lambda x: f"{x:,.0f}")
+    display_prod["Holdings"] = format_count_vec(prod_df["Holdings"])
 
     if is_btc:
-        display_prod["Type"] = display_prod["Is Miner"].apply(lambda x: "Miner" if x else "Treasury")
-        display_prod["Mining (BTC/yr)"] = display_prod["Mining (BTC/yr)"].apply(lambda x: f"{x:,.0f}" if x > 0 else "-")
-        display_prod["Burn (BTC/yr)"] = display_prod["Burn (BTC/yr)"].apply(lambda x: f"-{x:,.0f}")
-        display_prod["Net Acquired 2025"] = display_prod["Net Acquired 2025"].apply(
-            lambda x: f"+{x:,.0f}" if x >= 0 else f"{x:,.0f}"
-        )
-        display_prod["Net Rate"] = display_prod["Net Rate"].apply(
-            lambda x: f"+{x*100:.1f}%" if x >= 0 else f"{x*100:.1f}%"
-        )
-        display_prod["Status"] = display_prod["Accretive"].apply(
-            lambda x: "Accretive" if x else "Dilutive"
+        display_prod["Type"] = np.where(prod_df["Is Miner"], "Miner", "Treasury")
+        display_prod["Mining (BTC/yr)"] = np.where(
+            prod_df["Mining (BTC/yr)"] > 0, format_count_vec(prod_df["Mining (BTC/yr)"]), "-"
         )
+        display_prod["Burn (BTC/yr)"] = np.char.add("-", format_count_vec(prod_df["Burn (BTC/yr)"]))
+        display_prod["Net Acquired 2025"] = format_count_vec(prod_df["Net Acquired 2025"], signed=True)
+        display_prod["Net Rate"] = format_pct_vec(prod_df["Net Rate"], signed=True)
+        display_prod["Status"] = np.where(prod_df["Accretive"], "Accretive", "Dilutive")
         columns_to_show = [
             "Ticker", "Type", "Holdings", "Mining (BTC/yr)", "Burn (BTC/yr)", "Net Acquired 2025", "Net Rate", "Status"
         ]
     else:
-        display_prod[f"Yield ({asset}/yr)"] = display_prod[f"Yield ({asset}/yr)"].apply(lambda x: f"{x:,.0f}")
-        display_prod[f"Premium ({asset}/yr)"] = display_prod[f"Premium ({asset}/yr)"].apply(
-            lambda x: f"+{x:,.0f}" if x > 0 else "-"
-        )
-        display_prod[f"Burn ({asset}/yr)"] = display_prod[f"Burn ({asset}/yr)"].apply(lambda x: f"{x:,.0f}")
-        display_prod[f"Total ({asset}/yr)"] = display_prod[f"Total ({asset}/yr)"].apply(
-            lambda x: f"+{x:,.0f}" if x >= 0 else f"{x:,.0f}"
-        )
-        display_prod["Net Rate"] = display_prod["Net Rate"].apply(
-            lambda x: f"+{x*100:.1f}%" if x >= 0 else f"{x*100:.1f}%"
-        )
-        display_prod["Yield Multiple"] = display_prod["Yield Multiple"].apply(
-            lambda x: f"{x:.1f}x" if x >= 0 else f"{x:.1f}x"
-        )
-        display_prod["Status"] = display_prod["Accretive"].apply(
-            lambda x: "Accretive" if x else "Dilutive"
+        display_prod[f"Yield ({asset}/yr)"] = format_count_vec(prod_df[f"Yield ({asset}/yr)"])
+        display_prod[f"Premium ({asset}/yr)"] = np.where(
+            prod_df[f"Premium ({asset}/yr)"] > 0,
+            np.char.add("+", format_count_vec(prod_df[f"Premium ({asset}/yr)"])),
+            "-",
         )
+        display_prod[f"Burn ({asset}/yr)"] = format_count_vec(prod_df[f"Burn ({asset}/yr)"])
+        display_prod[f"Total ({asset}/yr)"] = format_count_vec(prod_df[f"Total ({asset}/yr)"], signed=True)
+        display_prod["Net Rate"] = format_pct_vec(prod_df["Net Rate"], signed=True)
+        display_prod["Yield Multiple"] = np.char.mod("%.1fx", prod_df["Yield Multiple"].to_numpy(dtype=float))
+        display_prod["Status"] = np.where(prod_df["Accretive"], "Accretive", "Dilutive")
         columns_to_show = [
             "Ticker", "Holdings", f"Yield ({asset}/yr)", f"Premium ({asset}/yr)",
             f"Burn ({asset}/yr)", f"Total ({asset}/yr)", "Net Rate", "Yield Multiple", "Status"
@@ -368,12 +414,12 @@ def render_productivity_section(asset: str, companies: Dict[str, Any], asset_pri
     )
 
     # Summary metrics
-    accretive_count = prod_df["Accretive"].sum()
+    accretive_count = totals["Accretive"]
 
     if is_btc:
         col1, col2, col3 = st.columns(3)
-        total_mining = prod_df["Mining (BTC/yr)"].sum()
-        total_acquired = prod_df["Net Acquired 2025"].sum()
+        total_mining = totals["Mining (BTC/yr)"]
+        total_acquired = totals["Net Acquired 2025"]
 
         with col1:
             st.metric("Total Mining", f"{total_mining:,.0f} BTC/yr")
@@ -384,7 +430,7 @@ def render_productivity_section(asset: str, companies: Dict[str, Any], asset_pri
                       delta=f"{int(accretive_count)}/{len(prod_df)} accretive")
 
         with col3:
-            total_holdings = prod_df["Holdings"].sum()
+            total_holdings = totals["Holdings"]
             avg_rate = (total_acquired / total_holdings * 100) if total_holdings > 0 else 0
             st.metric("Avg Net Rate", f"+{avg_rate:.1f}%")
 
@@ -396,10 +442,10 @@ def render_productivity_section(asset: str, companies: Dict[str, Any], asset_pri
         """)
     else:
         col1, col2, col3, col4 = st.columns(4)
-        total_yield = prod_df[f"Yield ({asset}/yr)"].sum()
-        total_premium = prod_df[f"Premium ({asset}/yr)"].sum()
-        total_burn = prod_df[f"Burn ({asset}/yr)"].sum()
-        total_productivity = prod_df[f"Total ({asset}/yr)"].sum()
+        total_yield = totals[f"Yield ({asset}/yr)"]
+        total_premium = totals[f"Premium ({asset}/yr)"]
+        total_burn = totals[f"Burn ({asset}/yr)"]
+        total_productivity = totals[f"Total ({asset}/yr)"]
 
         with col1:
             st.metric("Staking Yield", f"{total_yield:,.0f} {asset}/yr")
@@ -431,10 +477,11 @@ def render_other_dats_page() -> None:
 
     # Fetch prices
     with st.spinner("Loading prices..."):
-        btc_price = get_asset_price("BTC")
-        sol_price = get_asset_price("SOL")
-        hype_price = get_asset_price("HYPE")
-        bnb_price = get_asset_price("BNB")
+        prices = get_asset_prices(("BTC", "SOL", "HYPE", "BNB"))
+        btc_price = prices["BTC"]
+        sol_price = prices["SOL"]
+        hype_price = prices["HYPE"]
+        bnb_price = prices["BNB"]
 
     # Create tabs for each asset
     tab1, tab2, tab3, tab4 = st.tabs(["Bitcoin (BTC)", "Solana (SOL)", "Hyperliquid (HYPE)", "BNB Chain (BNB)"])
@@ -443,26 +490,30 @@ def render_other_dats_page() -> None:
         st.subheader("Bitcoin Treasury Companies")
         st.caption("The OG DAT strategy - started by MicroStrategy in Aug 2020")
         render_asset_section("BTC", BTC_DAT_COMPANIES, btc_price)
-        st.markdown("---")
-        render_productivity_section("BTC", BTC_DAT_COMPANIES, btc_price)
+        if has_holdings("BTC"):
+            st.markdown("---")
+            render_productivity_section("BTC", BTC_DAT_COMPANIES, btc_price)
 
     with tab2:
         st.subheader("Solana Treasury Companies")
         render_asset_section("SOL", SOL_DAT_COMPANIES, sol_price)
-        st.markdown("---")
-        render_productivity_section("SOL", SOL_DAT_COMPANIES, sol_price)
+        if has_holdings("SOL"):
+            st.markdown("---")
+            render_productivity_section("SOL", SOL_DAT_COMPANIES, sol_price)
 
     with tab3:
         st.subheader("Hyperliquid Treasury Companies")
         render_asset_section("HYPE", HYPE_DAT_COMPANIES, hype_price)
-        st.markdown("---")
-        render_productivity_section("HYPE", HYPE_DAT_COMPANIES, hype_price)
+        if has_holdings("HYPE"):
+            st.markdown("---")
+            render_productivity_section("HYPE", HYPE_DAT_COMPANIES, hype_price)
 
     with tab4:
         st.subheader("BNB Treasury Companies")
         render_asset_section("BNB", BNB_DAT_COMPANIES, bnb_price)
-        st.markdown("---")
-        render_productivity_section("BNB", BNB_DAT_COMPANIES, bnb_price)
+        if has_holdings("BNB"):
+            st.markdown("---")
+            render_productivity_section("BNB", BNB_DAT_COMPANIES, bnb_price)
 
     # Overall summary
     st.markdown("---")
@@ -471,25 +522,25 @@ def render_other_dats_page() -> None:
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        btc_total = sum(c["holdings"] for c in BTC_DAT_COMPANIES.values())
+        btc_total = ASSET_TOTALS["BTC"]
         btc_value = btc_total * btc_price
         st.metric("BTC Holdings", f"{btc_total:,.0f}", format_large_number(btc_value))
         st.caption(f"{len(BTC_DAT_COMPANIES)} companies")
 
     with col2:
-        sol_total = sum(c["holdings"] for c in SOL_DAT_COMPANIES.values())
+        sol_total = ASSET_TOTALS["SOL"]
         sol_value = sol_total * sol_price
         st.metric("SOL Holdings", f"{sol_total:,.0f}", format_large_number(sol_value))
         st.caption(f"{len(SOL_DAT_COMPANIES)} companies")
 
     with col3:
-        hype_total = sum(c["holdings"] for c in HYPE_DAT_COMPANIES.values())
+        hype_total = ASSET_TOTALS["HYPE"]
         hype_value = hype_total * hype_price
         st.metric("HYPE Holdings", f"{hype_total:,.0f}", format_large_number(hype_value))
         st.caption(f"{len(HYPE_DAT_COMPANIES)} companies")
 
     with col4:
-        bnb_total = sum(c["holdings"] for c in BNB_DAT_COMPANIES.values())
+        bnb_total = ASSET_TOTALS["BNB"]
         bnb_value = bnb_total * bnb_price
         st.metric("BNB Holdings", f"{bnb_total:,.0f}", format_large_number(bnb_value))
         st.caption(f"{len(BNB_DAT_COMPANIES)} companies")
@@ -3,71 +3,81 @@ Thesis Tracker Component
 Displays status and health of all 13 theses across 4 layers
 """
 import streamlit as st
-from typing import Dict, Any, List
-from config import THESES
+import pandas as pd
+from types import MappingProxyType
+from config import LAYER_NAMES, THESES, THESES_BY_LAYER, Thesis
+
+# Column view of THESES (one row per thesis number) for summary stats
+THESES_DF = pd.DataFrame(list(THESES.values()), index=list(THESES))
+
+# THESES is static - count once at import instead of on every rerun
+STATUS_COUNTS = THESES_DF["status"].value_counts().to_dict()
+CONVICTION_COUNTS = THESES_DF["conviction"].value_counts().to_dict()
+LAYER_COUNTS = THESES_DF["layer"].value_counts().to_dict()
+INVALIDATED_TITLES = THESES_DF.loc[THESES_DF["status"] == "invalidated", "title"].tolist()
+
+
+CONVICTION_COLORS = MappingProxyType({
+    "high": "green",
+    "medium-high": "blue",
+    "medium": "orange",
+    "low": "red",
+})
+
+STATUS_EMOJIS = MappingProxyType({
+    "active": "🟢",
+    "core": "⭐",
+    "worldview": "🌍",
+    "testing": "🧪",
+    "long-term": "🔮",
+    "invalidated": "❌",
+    "confirmed": "✅",
+})
 
 
 def get_conviction_color(conviction: str) -> str:
     """Get color based on conviction level"""
-    colors = {
-        "high": "green",
-        "medium-high": "blue",
-        "medium": "orange",
-        "low": "red",
-    }
-    return colors.get(conviction, "gray")
+    return CONVICTION_COLORS.get(conviction, "gray")
 
 
 def get_status_emoji(status: str) -> str:
     """Get emoji based on thesis status"""
-    emojis = {
-        "active": "🟢",
-        "core": "⭐",
-        "worldview": "🌍",
-        "testing": "🧪",
-        "long-term": "🔮",
-        "invalidated": "❌",
-        "confirmed": "✅",
-    }
-    return emojis.get(status, "⚪")
-
-
-def render_thesis_card(thesis_num: int, thesis: Dict[str, Any]) -> None:
-    """Render a single thesis card"""
-    status_emoji = get_status_emoji(thesis["status"])
-    conviction = thesis.get("conviction", "medium")
-
-    with st.expander(f"{status_emoji} Thesis {thesis_num}: {thesis['title']}", expanded=False):
-        st.markdown(f"**Core Claim:** {thesis['core_claim']}")
+    return STATUS_EMOJIS.get(status, "⚪")
 
-        col1, col2 = st.columns(2)
 
-        with col1:
-            st.markdown("**Conviction:** " + conviction.title())
-            st.markdown(f"**Status:** {thesis['status'].title()}")
+def render_thesis_card_body(thesis: Thesis) -> None:
+    """Render the contents of a thesis card"""
+    # One markdown element per card instead of a call per line
+    confirms = "\n".join(f"- ✅ {item}" for item in thesis.confirms)
+    refutes = "\n".join(f"- ❌ {item}" for item in thesis.refutes)
 
-        with col2:
-            st.markdown(f"**Layer:** {thesis['layer_name']}")
+    st.markdown(
+        f"**Core Claim:** {thesis.core_claim}\n\n"
+        f"**Conviction:** {thesis.conviction.title()}  \n"
+        f"**Status:** {thesis.status.title()}  \n"
+        f"**Layer:** {thesis.layer_name}\n\n"
+        "---\n\n"
+        f"**What Confirms It:**\n\n{confirms}\n\n"
+        f"**What Refutes It:**\n\n{refutes}"
+    )
 
-        st.markdown("---")
 
-        st.markdown("**What Confirms It:**")
-        for item in thesis.get("confirms", []):
-            st.caption(f"✅ {item}")
+def render_thesis_card(thesis_num: int, thesis: Thesis) -> None:
+    """Render a single thesis card"""
+    status_emoji = get_status_emoji(thesis.status)
 
-        st.markdown("**What Refutes It:**")
-        for item in thesis.get("refutes", []):
-            st.caption(f"❌ {item}")
+    with st.expander(f"{status_emoji} Thesis {thesis_num}: {thesis.title}", expanded=False):
+        render_thesis_card_body(thesis)
 
 
-def render_thesis_layer(layer: int, layer_name: str, theses: Dict[int, Dict]) -> None:
+def render_thesis_layer(layer: int) -> None:
     """Render all theses in a layer"""
-    layer_theses = {k: v for k, v in theses.items() if v["layer"] == layer}
+    layer_theses = THESES_BY_LAYER.get(layer, ())
 
     if not layer_theses:
         return
 
-    st.subheader(f"Layer {layer}: {layer_name}")
+    st.subheader(f"Layer {layer}: {LAYER_NAMES[layer]}")
 
     # Layer description
     descriptions = {
@@ -78,44 +88,30 @@ def render_thesis_layer(layer: int, layer_name: str, theses: Dict[int, Dict]) ->
     }
     st.caption(descriptions.get(layer, ""))
 
-    for thesis_num, thesis in layer_theses.items():
-        render_thesis_card(thesis_num, thesis)
+    for thesis_num in layer_theses:
+        render_thesis_card(thesis_num, THESES[thesis_num])
 
 
 def render_thesis_summary() -> None:
     """Render thesis summary statistics"""
     st.subheader("Thesis Summary")
 
-    # Count by status
-    status_counts = {}
-    conviction_counts = {}
-    layer_counts = {}
-
-    for thesis in THESES.values():
-        status = thesis["status"]
-        conviction = thesis.get("conviction", "medium")
-        layer = thesis["layer"]
-
-        status_counts[status] = status_counts.get(status, 0) + 1
-        conviction_counts[conviction] = conviction_counts.get(conviction, 0) + 1
-        layer_counts[layer] = layer_counts.get(layer, 0) + 1
-
     col1, col2, col3 = st.columns(3)
 
     with col1:
         st.markdown("**By Status:**")
-        for status, count in sorted(status_counts.items()):
+        for status, count in sorted(STATUS_COUNTS.items()):
             emoji = get_status_emoji(status)
             st.caption(f"{emoji} {status.title()}: {count}")
 
     with col2:
         st.markdown("**By Conviction:**")
-        for conviction, count in sorted(conviction_counts.items(), reverse=True):
+        for conviction, count in sorted(CONVICTION_COUNTS.items(), reverse=True):
             st.caption(f"• {conviction.title()}: {count}")
 
     with col3:
         st.markdown("**By Layer:**")
-        for layer, count in sorted(layer_counts.items()):
+        for layer, count in sorted(LAYER_COUNTS.items()):
             st.caption(f"• Layer {layer}: {count} theses")
 
 
@@ -123,30 +119,25 @@ def render_thesis_health_dashboard() -> None:
     """Render overall thesis health dashboard"""
     st.subheader("Thesis Health Overview")
 
-    # Check for any invalidated theses
-    invalidated = [t for t in THESES.values() if t["status"] == "invalidated"]
-    core_theses = [t for t in THESES.values() if t["status"] == "core"]
-    testing_theses = [t for t in THESES.values() if t["status"] == "testing"]
-
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
         st.metric("Total Theses", len(THESES))
 
     with col2:
-        health_status = "✅ Healthy" if not invalidated else "❌ Issues"
+        health_status = "✅ Healthy" if not INVALIDATED_TITLES else "❌ Issues"
         st.metric("Health", health_status)
 
     with col3:
-        st.metric("Core Theses", len(core_theses))
+        st.metric("Core Theses", STATUS_COUNTS.get("core", 0))
 
     with col4:
-        st.metric("Being Tested", len(testing_theses))
+        st.metric("Being Tested", STATUS_COUNTS.get("testing", 0))
 
-    if invalidated:
+    if INVALIDATED_TITLES:
         st.error("⚠️ Some theses have been invalidated! Review immediately.")
-        for thesis in invalidated:
-            st.caption(f"❌ {thesis['title']}")
+        for title in INVALIDATED_TITLES:
+            st.caption(f"❌ {title}")
 
 
 def render_thesis_tracker() -> None:
@@ -172,16 +163,16 @@ def render_thesis_tracker() -> None:
     ])
 
     with tab1:
-        render_thesis_layer(1, "Macro Worldview", THESES)
+        render_thesis_layer(1)
 
     with tab2:
-        render_thesis_layer(2, "Asset-Level", THESES)
+        render_thesis_layer(2)
 
     with tab3:
-        render_thesis_layer(3, "Structural/Infrastructure", THESES)
+        render_thesis_layer(3)
 
     with tab4:
-        render_thesis_layer(4, "Business (Reserve Labs)", THESES)
+        render_thesis_layer(4)
 
     with tab_all:
         st.subheader("All 13 Theses")
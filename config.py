@@ -3,11 +3,57 @@ Configuration for Thesis Tracking Dashboard
 Contains API keys, thresholds, DAT definitions, and thesis taxonomy
 """
 import os
-from dotenv import load_dotenv
+import pandas as pd
+from dataclasses import dataclass
+from datetime import date
+from enum import IntEnum
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Tuple
 
-load_dotenv()
+# Cache API keys across reruns when running under Streamlit
+try:
+    import streamlit as st
+    _cache_resource = st.cache_resource
+    _SECRETS = getattr(st, "secrets", None)
+except ImportError:
+    _cache_resource = cache
+    _SECRETS = None
+
+# Prefer the .env snapshot written by `python -m utils.compile_env`, unless
+# .env has been edited since it was generated. Deployments that inject real env
+# vars / st.secrets can set SKIP_DOTENV=1 (or ENV=production) to skip both.
+# _DOTENV_LOADED keeps Streamlit's module reloads from loading them again in
+# the same process.
+_ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+_ENV_SNAPSHOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "env_compiled.py")
+
+
+def _snapshot_is_current() -> bool:
+    """Whether env_compiled.py exists and is at least as new as .env"""
+    if not os.path.exists(_ENV_SNAPSHOT):
+        return False
+    return not os.path.exists(_ENV_FILE) or (
+        os.path.getmtime(_ENV_SNAPSHOT) >= os.path.getmtime(_ENV_FILE)
+    )
+
+
+_skip_dotenv = (
+    os.getenv("SKIP_DOTENV") == "1"
+    or os.getenv("ENV") == "production"
+    or os.getenv("_DOTENV_LOADED") == "1"
+)
+if not _skip_dotenv:
+    if _snapshot_is_current():
+        import env_compiled  # noqa: F401
+        os.environ["_DOTENV_LOADED"] = "1"
+    elif os.path.exists(_ENV_FILE):
+        from dotenv import load_dotenv
+        load_dotenv(_ENV_FILE)
+        os.environ["_DOTENV_LOADED"] = "1"
 
 # API Keys (set these in .env file, environment variables, or Streamlit secrets)
+@lru_cache(maxsize=None)
 def get_api_key(key_name: str, default: str = "") -> str:
     """Get API key from environment or Streamlit secrets"""
     # First try environment variable
@@ -16,30 +62,63 @@ def get_api_key(key_name: str, default: str = "") -> str:
         return value
 
     # Then try Streamlit secrets (for cloud deployment)
-    try:
-        import streamlit as st
-        if hasattr(st, 'secrets') and key_name in st.secrets:
-            return st.secrets[key_name]
-    except:
-        pass
+    if _SECRETS is not None:
+        try:
+            return _SECRETS[key_name]
+        except (KeyError, FileNotFoundError):  # key not set / no secrets.toml
+            pass
 
     return default
 
-FRED_API_KEY = get_api_key("FRED_API_KEY")
-ALPHA_VANTAGE_KEY = get_api_key("ALPHA_VANTAGE_KEY")  # Free: 25 calls/day
-FMP_API_KEY = get_api_key("FMP_API_KEY")  # Free: 250 calls/day
+API_KEY_NAMES = (
+    "FRED_API_KEY",
+    "ALPHA_VANTAGE_KEY",  # Free: 25 calls/day
+    "FMP_API_KEY",  # Free: 250 calls/day
+)
+
+
+@_cache_resource
+def load_api_keys() -> Mapping[str, str]:
+    """Resolve all API keys once, on first use; read-only since it's shared across sessions"""
+    return MappingProxyType({key_name: get_api_key(key_name) for key_name in API_KEY_NAMES})
+
+
+def fred_api_key() -> str:
+    """FRED API key ("" if not configured)"""
+    return load_api_keys()["FRED_API_KEY"]
+
+
+def alpha_vantage_key() -> str:
+    """Alpha Vantage API key ("" if not configured)"""
+    return load_api_keys()["ALPHA_VANTAGE_KEY"]
+
+
+def fmp_api_key() -> str:
+    """Financial Modeling Prep API key ("" if not configured)"""
+    return load_api_keys()["FMP_API_KEY"]
+
+# Everything below is static data, kept as Python literals on purpose: it loads
+# from the cached .pyc in ~40us, faster than parsing the same data from JSON.
 
 # Edwin's Personal Positions
+@dataclass(slots=True, frozen=True)
+class Position:
+    """A personal holding: share count for stocks, amount for tokens"""
+    shares: Optional[int] = None
+    amount: Optional[float] = None
+    cost_basis: Optional[float] = None
+
+
 PERSONAL_POSITIONS = {
-    "BMNR": {"shares": 10000, "cost_basis": None},
-    "SBET": {"shares": 10000, "cost_basis": None},
-    "ETH": {"amount": None, "cost_basis": None},  # Update with actual holdings
+    "BMNR": Position(shares=10000),
+    "SBET": Position(shares=10000),
+    "ETH": Position(),  # Update with actual holdings (amount, cost_basis)
 }
 
 # Personal Timeline
 PERSONAL_MILESTONES = {
-    "wedding": "2026-06-01",  # Update with actual date
-    "family_planning": "2027-06-01",  # Q2-Q3 2027
+    "wedding": date(2026, 6, 1),  # Update with actual date
+    "family_planning": date(2027, 6, 1),  # Q2-Q3 2027
 }
 
 # Staking ETF benchmark
@@ -55,13 +134,14 @@ ETF_STAKING_YIELD = 0.032  # 3.2% - Grayscale ETH Mini Trust net yield after 0.1
 #   Assumes: ATM 20%, PIPE 25%, Converts 10%, small caps 5-10%
 #   Testable: If ETH/share grows faster than staking yield, premium capture is working
 # dat_start_date: When company pivoted to DAT strategy (for annualizing premium capture)
+DEFAULT_DAT_START = date(2024, 1, 1)  # Assumed when dat_start_date is missing
+
 DAT_COMPANIES = {
     # Tier 1: Major Players (>100k ETH)
     "BMNR": {
         "name": "Bitmine Immersion",
-        "ticker": "BMNR",
         "tier": 1,
-        "dat_start_date": "2025-07-01",  # Pivoted to DAT strategy July 2025
+        "dat_start_date": date(2025, 7, 1),  # Pivoted to DAT strategy July 2025
         "eth_holdings": 4_066_000,  # Dec 21, 2025 per press release
         "staking_pct": 0.85,  # 85% staked via MAVAN validators
         "staking_method": "MAVAN validators",
@@ -76,14 +156,12 @@ DAT_COMPANIES = {
         "eth_from_premium": 510_000,  # 476K + 35K from premium capture
         "leader": "Tom Lee (Fundstrat)",
         "strategy": "5% of ETH supply goal, staking, MAVAN validators Q1 2026",
-        "shares_outstanding": None,
         "notes": "Largest ETH treasury. NAV ~$30/share. Trades at 0.8x book. $24.5B ATM capacity.",
     },
     "SBET": {
         "name": "SharpLink Gaming",
-        "ticker": "SBET",
         "tier": 1,
-        "dat_start_date": "2025-05-01",  # First major ETH acquisition May 2025
+        "dat_start_date": date(2025, 5, 1),  # First major ETH acquisition May 2025
         "eth_holdings": 860_000,  # Oct 2025: 859,853 ETH per press release
         "staking_pct": 0.95,  # 95% staked via Linea/Lido
         "staking_method": "Linea/Lido",
@@ -98,14 +176,12 @@ DAT_COMPANIES = {
         "eth_from_premium": 103_000,  # 74K + 29K from premium capture
         "leader": "Joe Lubin (Ethereum co-founder)",
         "strategy": "Staking, Linea partnership, tokenized equity via Superstate",
-        "shares_outstanding": None,
         "notes": "#2 ETH treasury. $1.5B buyback program. Trades at ~0.83x mNAV.",
     },
     "ETHM": {
         "name": "The Ether Machine",
-        "ticker": "ETHM",
         "tier": 1,
-        "dat_start_date": "2025-10-01",  # SPAC merger announced Oct 2025
+        "dat_start_date": date(2025, 10, 1),  # SPAC merger announced Oct 2025
         "eth_holdings": 495_362,  # Per CoinGecko/company data
         "staking_pct": 1.0,  # 100% staked - "fully staked treasury"
         "staking_method": "Native staking",
@@ -118,14 +194,12 @@ DAT_COMPANIES = {
         "eth_from_premium": 0,  # N/A - SPAC merger structure
         "leader": "Andrew Keys",
         "strategy": "DeFi/staking 'machine' to grow ETH",
-        "shares_outstanding": None,
         "notes": "SPAC merger with Dynamix (ETHM). Trades at 24% premium. 3rd largest ETH treasury.",
     },
     "BTBT": {
         "name": "Bit Digital",
-        "ticker": "BTBT",
         "tier": 1,
-        "dat_start_date": "2025-01-01",  # Pivoted from BTC mining to ETH staking Jan 2025
+        "dat_start_date": date(2025, 1, 1),  # Pivoted from BTC mining to ETH staking Jan 2025
         "eth_holdings": 154_000,  # Oct 2025: 153,547 ETH per monthly report
         "staking_pct": 0.86,  # 86.3% staked per Oct report
         "staking_method": "Native staking",
@@ -140,15 +214,13 @@ DAT_COMPANIES = {
         "eth_from_premium": 9_500,  # 3.2K + 6.4K from premium capture
         "leader": "Sam Tabar",
         "strategy": "86% staked, fully exited BTC. Avg cost $3,045/ETH.",
-        "shares_outstanding": None,
         "notes": "Staking yield ~2.93% annualized. mNAV $3.84/share (Sep 2025).",
     },
     # Tier 2: Mid-Size (10k-100k ETH)
     "ETHZ": {
         "name": "ETHZilla",
-        "ticker": "ETHZ",
         "tier": 2,
-        "dat_start_date": "2024-07-01",  # Early DAT, now pivoting away
+        "dat_start_date": date(2024, 7, 1),  # Early DAT, now pivoting away
         "eth_holdings": 69_802,  # Dec 2025 - sold 24,291 ETH ($74.5M) to pay down debt
         "staking_pct": 0.80,  # Estimated 80% staked
         "staking_method": "Native staking",
@@ -161,14 +233,12 @@ DAT_COMPANIES = {
         "eth_from_premium": 0,  # Actually sold $114.5M ETH (Oct+Dec)
         "leader": "Peter Thiel backed",
         "strategy": "Pivoting to RWA tokenization, sold ETH for debt paydown & buybacks",
-        "shares_outstanding": None,
         "notes": "Sold $40M ETH (Oct) + $74.5M ETH (Dec). Stock down 96% from Aug highs. Discontinued mNAV dashboard.",
     },
     "BTCS": {
         "name": "BTCS Inc.",
-        "ticker": "BTCS",
         "tier": 2,
-        "dat_start_date": "2024-01-01",  # One of earliest DATs
+        "dat_start_date": date(2024, 1, 1),  # One of earliest DATs
         "eth_holdings": 70_000,
         "staking_pct": 0.75,  # 75% staked via Builder+
         "staking_method": "Builder+ validators",
@@ -181,14 +251,12 @@ DAT_COMPANIES = {
         "eth_from_premium": 1_600,  # $60M × (0.10/1.10) / $3,500
         "leader": "",
         "strategy": "ETH 'Bividend,' DeFi/TradFi flywheel, Builder+",
-        "shares_outstanding": None,
         "notes": "",
     },
     "GAME": {
         "name": "GameSquare",
-        "ticker": "GAME",
         "tier": 2,
-        "dat_start_date": "2024-10-01",  # Started ETH strategy Oct 2024
+        "dat_start_date": date(2024, 10, 1),  # Started ETH strategy Oct 2024
         "eth_holdings": 10_000,
         "staking_pct": 0.50,  # Estimated 50% - newer to ETH
         "staking_method": "Lido/stETH",
@@ -201,14 +269,12 @@ DAT_COMPANIES = {
         "eth_from_premium": 400,  # $30M × (0.05/1.05) / $3,500
         "leader": "",
         "strategy": "$250M authorization for more",
-        "shares_outstanding": None,
         "notes": "High burn rate relative to ETH holdings.",
     },
     "FGNX": {
         "name": "Fundamental Global",
-        "ticker": "FGNX",
         "tier": 2,
-        "dat_start_date": "2024-09-01",  # Started ETH strategy Sep 2024
+        "dat_start_date": date(2024, 9, 1),  # Started ETH strategy Sep 2024
         "eth_holdings": 6_000,
         "staking_pct": 0.60,  # Estimated 60%
         "staking_method": "Lido/stETH",
@@ -221,7 +287,6 @@ DAT_COMPANIES = {
         "eth_from_premium": 270,  # $20M × (0.05/1.05) / $3,500
         "leader": "",
         "strategy": "Insurance/reinsurance pivot",
-        "shares_outstanding": None,
         "notes": "",
     },
 }
@@ -232,9 +297,8 @@ DAT_COMPANIES = {
 SOL_DAT_COMPANIES = {
     "FWDI": {
         "name": "Forward Industries",
-        "ticker": "FWDI",
         "tier": 1,
-        "dat_start_date": "2025-04-01",  # Pivot announced ~Q2 2025
+        "dat_start_date": date(2025, 4, 1),  # Pivot announced ~Q2 2025
         "holdings": 6_921_342,  # Dec 2025
         "asset": "SOL",
         "cost_basis_avg": 232.08,  # per SOL
@@ -253,9 +317,8 @@ SOL_DAT_COMPANIES = {
     },
     "HSDT": {
         "name": "Solana Company (fka Helius Medical)",
-        "ticker": "HSDT",
         "tier": 1,
-        "dat_start_date": "2025-05-01",
+        "dat_start_date": date(2025, 5, 1),
         "holdings": 2_200_000,  # Oct 2025 estimate
         "asset": "SOL",
         "cost_basis_avg": 227.00,
@@ -273,9 +336,8 @@ SOL_DAT_COMPANIES = {
     },
     "DFDV": {
         "name": "DeFi Development Corp",
-        "ticker": "DFDV",
         "tier": 1,
-        "dat_start_date": "2025-04-01",
+        "dat_start_date": date(2025, 4, 1),
         "holdings": 2_195_926,  # Oct 2025
         "asset": "SOL",
         "cost_basis_avg": 110.00,
@@ -294,9 +356,8 @@ SOL_DAT_COMPANIES = {
     },
     "UPXI": {
         "name": "Upexi",
-        "ticker": "UPXI",
         "tier": 1,
-        "dat_start_date": "2025-04-01",
+        "dat_start_date": date(2025, 4, 1),
         "holdings": 2_106_989,  # Oct 2025
         "asset": "SOL",
         "cost_basis_avg": 157.66,
@@ -313,10 +374,9 @@ SOL_DAT_COMPANIES = {
         "notes": "42% locked SOL at mid-teens discount. $50M buyback approved Nov 2025.",
     },
     "HODL": {
-        "name": "Sol Strategies",
-        "ticker": "HODL",  # CSE: HODL, NASDAQ: STKE
+        "name": "Sol Strategies",  # CSE: HODL, NASDAQ: STKE
         "tier": 2,
-        "dat_start_date": "2024-06-01",  # Earlier than US companies
+        "dat_start_date": date(2024, 6, 1),  # Earlier than US companies
         "holdings": 526_637,  # Nov 2025
         "asset": "SOL",
         "cost_basis_avg": 130.00,
@@ -339,9 +399,8 @@ SOL_DAT_COMPANIES = {
 HYPE_DAT_COMPANIES = {
     "PURR": {
         "name": "Hyperliquid Strategies",
-        "ticker": "PURR",
         "tier": 1,
-        "dat_start_date": "2025-12-01",  # Merger closed Dec 2025
+        "dat_start_date": date(2025, 12, 1),  # Merger closed Dec 2025
         "holdings": 12_600_000,  # Dec 2025 merger close
         "asset": "HYPE",
         "cost_basis_avg": 46.27,  # $583M / 12.6M
@@ -360,9 +419,8 @@ HYPE_DAT_COMPANIES = {
     },
     "HYPD": {
         "name": "Hyperion DeFi (fka Eyenovia)",
-        "ticker": "HYPD",
         "tier": 2,
-        "dat_start_date": "2025-07-01",  # Rebranded Jul 2025
+        "dat_start_date": date(2025, 7, 1),  # Rebranded Jul 2025
         "holdings": 1_712_195,  # Sep 2025
         "asset": "HYPE",
         "cost_basis_avg": 38.25,
@@ -385,9 +443,8 @@ HYPE_DAT_COMPANIES = {
 BNB_DAT_COMPANIES = {
     "BNC": {
         "name": "BNB Network Company (CEA Industries)",
-        "ticker": "BNC",
         "tier": 1,
-        "dat_start_date": "2025-06-01",
+        "dat_start_date": date(2025, 6, 1),
         "holdings": 500_000,  # Dec 2025
         "asset": "BNB",
         "cost_basis_avg": 870.00,  # ~$435M for 500K per filing
@@ -405,9 +462,8 @@ BNB_DAT_COMPANIES = {
     },
     "WINT": {
         "name": "Windtree Therapeutics",
-        "ticker": "WINT",
         "tier": 2,
-        "dat_start_date": "2025-08-01",
+        "dat_start_date": date(2025, 8, 1),
         "holdings": 100_000,  # Estimated from $520M commitment
         "asset": "BNB",
         "cost_basis_avg": 650.00,
@@ -425,9 +481,8 @@ BNB_DAT_COMPANIES = {
     },
     "NA": {
         "name": "Nano Labs",
-        "ticker": "NA",
         "tier": 2,
-        "dat_start_date": "2025-06-01",
+        "dat_start_date": date(2025, 6, 1),
         "holdings": 128_000,  # Jul 2025
         "asset": "BNB",
         "cost_basis_avg": 600.00,
@@ -452,9 +507,8 @@ BNB_DAT_COMPANIES = {
 BTC_DAT_COMPANIES = {
     "MSTR": {
         "name": "Strategy (fka MicroStrategy)",
-        "ticker": "MSTR",
         "tier": 1,
-        "dat_start_date": "2024-01-01",  # Use 2024 as base - when 21/21 plan started
+        "dat_start_date": date(2024, 1, 1),  # Use 2024 as base - when 21/21 plan started
         "holdings": 672_497,  # Dec 29, 2025 - per strategy.com/purchases
         "asset": "BTC",
         "cost_basis_avg": 74_997,  # $50.44B / 672K BTC
@@ -478,9 +532,8 @@ BTC_DAT_COMPANIES = {
     },
     "MARA": {
         "name": "Marathon Digital",
-        "ticker": "MARA",
         "tier": 1,
-        "dat_start_date": "2024-01-01",
+        "dat_start_date": date(2024, 1, 1),
         "holdings": 44_893,  # Dec 2025 per bitcointreasuries.net
         "asset": "BTC",
         "cost_basis_avg": 43_000,
@@ -498,9 +551,8 @@ BTC_DAT_COMPANIES = {
     },
     "RIOT": {
         "name": "Riot Platforms",
-        "ticker": "RIOT",
         "tier": 1,
-        "dat_start_date": "2024-01-01",
+        "dat_start_date": date(2024, 1, 1),
         "holdings": 17_722,  # Dec 2025
         "asset": "BTC",
         "cost_basis_avg": 39_000,
@@ -518,9 +570,8 @@ BTC_DAT_COMPANIES = {
     },
     "CLSK": {
         "name": "CleanSpark",
-        "ticker": "CLSK",
         "tier": 1,
-        "dat_start_date": "2024-01-01",
+        "dat_start_date": date(2024, 1, 1),
         "holdings": 10_556,  # Dec 2025
         "asset": "BTC",
         "cost_basis_avg": 45_000,
@@ -538,9 +589,8 @@ BTC_DAT_COMPANIES = {
     },
     "HUT": {
         "name": "Hut 8",
-        "ticker": "HUT",
         "tier": 1,
-        "dat_start_date": "2024-01-01",
+        "dat_start_date": date(2024, 1, 1),
         "holdings": 10_208,  # Dec 2025
         "asset": "BTC",
         "cost_basis_avg": 24_000,  # Lowest cost basis among majors
@@ -558,9 +608,8 @@ BTC_DAT_COMPANIES = {
     },
     "ASST": {
         "name": "Strive Asset Management",
-        "ticker": "ASST",
         "tier": 1,
-        "dat_start_date": "2024-05-01",  # Semler started May 2024
+        "dat_start_date": date(2024, 5, 1),  # Semler started May 2024
         "holdings": 10_900,  # Post-merger with Semler
         "asset": "BTC",
         "cost_basis_avg": 100_000,
@@ -582,9 +631,8 @@ BTC_DAT_COMPANIES = {
     },
     "BITF": {
         "name": "Bitfarms",
-        "ticker": "BITF",
         "tier": 2,
-        "dat_start_date": "2024-01-01",
+        "dat_start_date": date(2024, 1, 1),
         "holdings": 1_188,  # Dec 2025 (reduced - sells monthly)
         "asset": "BTC",
         "cost_basis_avg": 55_000,
@@ -602,9 +650,8 @@ BTC_DAT_COMPANIES = {
     },
     "WULF": {
         "name": "TeraWulf",
-        "ticker": "WULF",
         "tier": 2,
-        "dat_start_date": "2024-01-01",
+        "dat_start_date": date(2024, 1, 1),
         "holdings": 699,  # Dec 2025 (sells most production)
         "asset": "BTC",
         "cost_basis_avg": 60_000,
@@ -622,9 +669,8 @@ BTC_DAT_COMPANIES = {
     },
     "KULR": {
         "name": "KULR Technology",
-        "ticker": "KULR",
         "tier": 2,
-        "dat_start_date": "2024-12-01",  # Very recent
+        "dat_start_date": date(2024, 12, 1),  # Very recent
         "holdings": 510,  # Jan 2026
         "asset": "BTC",
         "cost_basis_avg": 97_000,
@@ -642,9 +688,8 @@ BTC_DAT_COMPANIES = {
     },
     "CIFR": {
         "name": "Cipher Mining",
-        "ticker": "CIFR",
         "tier": 2,
-        "dat_start_date": "2024-01-01",
+        "dat_start_date": date(2024, 1, 1),
         "holdings": 1_034,  # Dec 2025
         "asset": "BTC",
         "cost_basis_avg": 50_000,
@@ -667,12 +712,12 @@ PHASES = {
     "accumulation": {
         "name": "Phase 6a: Accumulation",
         "description": "Current phase - NAV discount/premium drives valuation",
-        "metrics": ["eth_holdings", "eth_per_share", "nav_discount", "dilution_rate"],
+        "metrics": ("eth_holdings", "eth_per_share", "nav_discount", "dilution_rate"),
     },
     "transition": {
         "name": "Phase 6b: Transition",
         "description": "Hybrid NAV → Earnings valuation",
-        "signals": ["dividend_announced", "ops_costs_declining", "analyst_narrative_shift", "nav_discount_narrowing"],
+        "signals": ("dividend_announced", "ops_costs_declining", "analyst_narrative_shift", "nav_discount_narrowing"),
     },
     "terminal": {
         "name": "Phase 6c: Terminal",
@@ -683,239 +728,250 @@ PHASES = {
 }
 
 # Thesis Definitions
+LAYER_NAMES = {
+    1: "Macro Worldview",
+    2: "Asset-Level",
+    3: "Structural/Infrastructure",
+    4: "Business (Reserve Labs)",
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Thesis:
+    """A single thesis in the four-layer taxonomy"""
+    layer: int
+    title: str
+    core_claim: str
+    confirms: Tuple[str, ...]
+    refutes: Tuple[str, ...]
+    status: str
+    conviction: str = "medium"
+
+    @property
+    def layer_name(self) -> str:
+        return LAYER_NAMES[self.layer]
+
+
 THESES = {
     # Layer 1: Macro Worldview
-    1: {
-        "layer": 1,
-        "layer_name": "Macro Worldview",
-        "title": "Fiscal Dominance & Dollar Endgame",
-        "core_claim": "Sovereign debt dynamics have shifted from monetary to fiscal dominance. The US cannot sustain its debt trajectory without default, inflation, or financial repression.",
-        "confirms": [
+    1: Thesis(
+        layer=1,
+        title="Fiscal Dominance & Dollar Endgame",
+        core_claim="Sovereign debt dynamics have shifted from monetary to fiscal dominance. The US cannot sustain its debt trajectory without default, inflation, or financial repression.",
+        confirms=(
             "Continued deficit spending regardless of rate environment",
             "Fed forced to accommodate Treasury issuance",
             "Real rates staying negative despite nominal hikes",
             "Dollar losing reserve status gradually",
-        ],
-        "refutes": [
+        ),
+        refutes=(
             "Sustained fiscal consolidation",
             "Productivity boom that grows out of debt",
             "Dollar strengthening while debt grows indefinitely",
-        ],
-        "status": "worldview",
-        "conviction": "high",
-    },
-    2: {
-        "layer": 1,
-        "layer_name": "Macro Worldview",
-        "title": "Liquidity Mechanics > Narratives",
-        "core_claim": "Global liquidity plumbing drives asset prices more than fundamentals or narratives in the short-to-medium term.",
-        "confirms": [
+        ),
+        status="worldview",
+        conviction="high",
+    ),
+    2: Thesis(
+        layer=1,
+        title="Liquidity Mechanics > Narratives",
+        core_claim="Global liquidity plumbing drives asset prices more than fundamentals or narratives in the short-to-medium term.",
+        confirms=(
             "Risk assets correlating tightly with net liquidity measures",
             "Narrative-driven rallies failing when liquidity drains",
             "'Bad news is good news' dynamics",
-        ],
-        "refutes": [
+        ),
+        refutes=(
             "Major assets decoupling from liquidity",
             "Fundamentals mattering more than liquidity for sustained periods",
-        ],
-        "status": "active",
-        "conviction": "high",
-    },
-    3: {
-        "layer": 1,
-        "layer_name": "Macro Worldview",
-        "title": "Speculation Precedes Adoption",
-        "core_claim": "Markets price narratives before fundamentals materialize, then crash before real adoption matures.",
-        "confirms": [
+        ),
+        status="active",
+        conviction="high",
+    ),
+    3: Thesis(
+        layer=1,
+        title="Speculation Precedes Adoption",
+        core_claim="Markets price narratives before fundamentals materialize, then crash before real adoption matures.",
+        confirms=(
             "ETH/crypto usage growing during bear markets",
             "Speculative bubbles forming on potential, not revenue",
             "Post-crash organic growth exceeding bubble-era growth",
-        ],
-        "refutes": [
+        ),
+        refutes=(
             "Adoption and price correlating tightly",
             "Speculation never returning after adoption matures",
-        ],
-        "status": "active",
-        "conviction": "high",
-    },
+        ),
+        status="active",
+        conviction="high",
+    ),
     # Layer 2: Asset-Level Theses
-    4: {
-        "layer": 2,
-        "layer_name": "Asset-Level",
-        "title": "ETH as Productive Capital → Store of Value",
-        "core_claim": "ETH becomes a store of value through demonstrated monetization efficiency, not instead of it. DAT companies generating consistent yield are the proof mechanism.",
-        "confirms": [
+    4: Thesis(
+        layer=2,
+        title="ETH as Productive Capital → Store of Value",
+        core_claim="ETH becomes a store of value through demonstrated monetization efficiency, not instead of it. DAT companies generating consistent yield are the proof mechanism.",
+        confirms=(
             "DAT yield consistency over multiple cycles",
             "ETH outperforming as collateral",
             "Institutions holding ETH for yield, not just speculation",
             "ETH volatility declining relative to other crypto",
-        ],
-        "refutes": [
+        ),
+        refutes=(
             "DAT yield strategies failing or compressing to zero",
             "ETH remaining purely speculative",
             "Alternative assets capturing 'productive store of value' narrative",
-        ],
-        "status": "core",
-        "conviction": "high",
-    },
-    5: {
-        "layer": 2,
-        "layer_name": "Asset-Level",
-        "title": "BTC vs ETH Role Separation",
-        "core_claim": "Bitcoin becomes neutral reserve collateral. Ethereum becomes the financial operating system. Complementary, not competitive.",
-        "confirms": [
+        ),
+        status="core",
+        conviction="high",
+    ),
+    5: Thesis(
+        layer=2,
+        title="BTC vs ETH Role Separation",
+        core_claim="Bitcoin becomes neutral reserve collateral. Ethereum becomes the financial operating system. Complementary, not competitive.",
+        confirms=(
             "BTC adopted as reserve asset (sovereign, corporate, ETF)",
             "ETH adopted as infrastructure (DeFi, tokenization, settlement)",
             "Minimal overlap in use cases over time",
-        ],
-        "refutes": [
+        ),
+        refutes=(
             "BTC developing smart contract capabilities",
             "ETH absorbing monetary premium",
             "Neither winning (stablecoins or CBDCs dominating)",
-        ],
-        "status": "active",
-        "conviction": "medium-high",
-    },
-    6: {
-        "layer": 2,
-        "layer_name": "Asset-Level",
-        "title": "DAT as Asset Class (Phased Evolution)",
-        "core_claim": "DAT companies evolve through distinct phases: Accumulation → Transition → Terminal (ETH royalty companies at 40-50x P/E).",
-        "confirms": [
+        ),
+        status="active",
+        conviction="medium-high",
+    ),
+    6: Thesis(
+        layer=2,
+        title="DAT as Asset Class (Phased Evolution)",
+        core_claim="DAT companies evolve through distinct phases: Accumulation → Transition → Terminal (ETH royalty companies at 40-50x P/E).",
+        confirms=(
             "Dividend initiation by major DATs",
             "Operational costs declining as % of treasury",
             "Analyst language shifting to P/E focus",
             "NAV discounts narrowing",
-        ],
-        "refutes": [
+        ),
+        refutes=(
             "DATs failing to generate consistent yield",
             "Permanent NAV discounts",
             "DAT model abandoned by market",
-        ],
-        "status": "core",
-        "conviction": "high",
-    },
+        ),
+        status="core",
+        conviction="high",
+    ),
     # Layer 3: Structural/Infrastructure Theses
-    7: {
-        "layer": 3,
-        "layer_name": "Structural/Infrastructure",
-        "title": "Tokenization ≠ Liquidity",
-        "core_claim": "Tokenizing assets does not automatically create liquidity. Liquidity must be engineered through derivatives, arbitrage, leverage, and incentive design.",
-        "confirms": [
+    7: Thesis(
+        layer=3,
+        title="Tokenization ≠ Liquidity",
+        core_claim="Tokenizing assets does not automatically create liquidity. Liquidity must be engineered through derivatives, arbitrage, leverage, and incentive design.",
+        confirms=(
             "Tokenized assets sitting illiquid despite being on-chain",
             "Derivatives volume exceeding spot volume for liquid assets",
             "Projects that engineer liquidity outperforming",
-        ],
-        "refutes": [
+        ),
+        refutes=(
             "Tokenization alone driving deep liquidity",
             "Spot markets becoming more important than derivatives",
-        ],
-        "status": "active",
-        "conviction": "high",
-    },
-    8: {
-        "layer": 3,
-        "layer_name": "Structural/Infrastructure",
-        "title": "Data as Financial Primitive",
-        "core_claim": "Settlement-grade data becomes infrastructure. Real-time, verifiable balance sheet data enables new financial products.",
-        "confirms": [
+        ),
+        status="active",
+        conviction="high",
+    ),
+    8: Thesis(
+        layer=3,
+        title="Data as Financial Primitive",
+        core_claim="Settlement-grade data becomes infrastructure. Real-time, verifiable balance sheet data enables new financial products.",
+        confirms=(
             "Products built on real-time data outperforming traditional",
             "Oracles becoming critical infrastructure",
             "Companies willing to pay for real-time data",
-        ],
-        "refutes": [
+        ),
+        refutes=(
             "Quarterly filings remaining sufficient",
             "Data commoditizing (no moat)",
-        ],
-        "status": "active",
-        "conviction": "high",
-    },
-    9: {
-        "layer": 3,
-        "layer_name": "Structural/Infrastructure",
-        "title": "Volatility & Derivatives as Value Engines",
-        "core_claim": "Volatility itself is a monetizable resource. Derivatives often generate more value than spot markets.",
-        "confirms": [
+        ),
+        status="active",
+        conviction="high",
+    ),
+    9: Thesis(
+        layer=3,
+        title="Volatility & Derivatives as Value Engines",
+        core_claim="Volatility itself is a monetizable resource. Derivatives often generate more value than spot markets.",
+        confirms=(
             "Derivatives volume multiples of spot volume in mature markets",
             "Volatility products driving exchange revenue",
             "DAT premiums correlating with implied volatility",
-        ],
-        "refutes": [
+        ),
+        refutes=(
             "Spot markets dominating derivatives long-term",
             "Volatility compressing permanently",
-        ],
-        "status": "active",
-        "conviction": "high",
-    },
-    10: {
-        "layer": 3,
-        "layer_name": "Structural/Infrastructure",
-        "title": "Regulatory Convergence (Hybrid Rails)",
-        "core_claim": "Regulation reshapes topology. Hybrid systems (permissioned + public) emerge and coexist.",
-        "confirms": [
+        ),
+        status="active",
+        conviction="high",
+    ),
+    10: Thesis(
+        layer=3,
+        title="Regulatory Convergence (Hybrid Rails)",
+        core_claim="Regulation reshapes topology. Hybrid systems (permissioned + public) emerge and coexist.",
+        confirms=(
             "Institutional adoption via regulated wrappers (ETFs, custodians)",
             "Canton/permissioned systems growing alongside public chains",
             "CLARITY Act or similar providing safe harbors",
-        ],
-        "refutes": [
+        ),
+        refutes=(
             "Full on-chain migration (no hybrid needed)",
             "Regulation killing on-chain activity entirely",
-        ],
-        "status": "active",
-        "conviction": "medium-high",
-    },
+        ),
+        status="active",
+        conviction="medium-high",
+    ),
     # Layer 4: Business Theses (Reserve Labs)
-    11: {
-        "layer": 4,
-        "layer_name": "Business (Reserve Labs)",
-        "title": "Institutional Demand for DAT Derivatives Exists",
-        "core_claim": "Billions in capital are trading DAT premiums through complex multi-leg positions. This demand can be captured.",
-        "confirms": [
+    11: Thesis(
+        layer=4,
+        title="Institutional Demand for DAT Derivatives Exists",
+        core_claim="Billions in capital are trading DAT premiums through complex multi-leg positions. This demand can be captured.",
+        confirms=(
             "13F filings showing fund positions in DATs",
             "Options/convertible activity on MSTR, MARA, etc.",
             "Direct conversations confirming demand",
-        ],
-        "refutes": [
+        ),
+        refutes=(
             "Institutional interest fading",
             "Existing instruments being sufficient",
-        ],
-        "status": "active",
-        "conviction": "high",
-    },
-    12: {
-        "layer": 4,
-        "layer_name": "Business (Reserve Labs)",
-        "title": "Data Licensing as Partnership Wedge",
-        "core_claim": "DAT companies will partner for data licensing and revenue sharing rather than requiring traditional LOIs or equity deals.",
-        "confirms": [
+        ),
+        status="active",
+        conviction="high",
+    ),
+    12: Thesis(
+        layer=4,
+        title="Data Licensing as Partnership Wedge",
+        core_claim="DAT companies will partner for data licensing and revenue sharing rather than requiring traditional LOIs or equity deals.",
+        confirms=(
             "Companies engaging on rev-share proposals",
             "Data partnerships closing",
             "Companies seeing data as asset to monetize",
-        ],
-        "refutes": [
+        ),
+        refutes=(
             "Companies unwilling to share data",
             "Demanding equity or traditional structures",
-        ],
-        "status": "testing",
-        "conviction": "medium",
-    },
-    13: {
-        "layer": 4,
-        "layer_name": "Business (Reserve Labs)",
-        "title": "AI/Agentic Economy Needs On-Chain Rails",
-        "core_claim": "AI agents will transact autonomously and need deterministic, programmable finance. Ethereum becomes machine-native finance.",
-        "confirms": [
+        ),
+        status="testing",
+        conviction="medium",
+    ),
+    13: Thesis(
+        layer=4,
+        title="AI/Agentic Economy Needs On-Chain Rails",
+        core_claim="AI agents will transact autonomously and need deterministic, programmable finance. Ethereum becomes machine-native finance.",
+        confirms=(
             "AI agents using crypto for payments/settlement",
             "Agent-to-agent transactions growing",
             "Composability becoming more valuable than UX",
-        ],
-        "refutes": [
+        ),
+        refutes=(
             "AI agents using traditional rails",
             "Centralized platforms handling settlement internally",
-        ],
-        "status": "long-term",
-        "conviction": "medium",
-    },
+        ),
+        status="long-term",
+        conviction="medium",
+    ),
 }
 
 # Invalidation Thresholds
@@ -961,9 +1017,51 @@ ALERT_THRESHOLDS = {
 }
 
 # Health Status Definitions
-HEALTH_STATUS = {
-    "healthy": {"emoji": "✅", "color": "green", "label": "Healthy"},
-    "warning": {"emoji": "⚠️", "color": "orange", "label": "Warning"},
-    "critical": {"emoji": "❌", "color": "red", "label": "Critical"},
-    "unknown": {"emoji": "❓", "color": "gray", "label": "Unknown"},
-}
+class Health(IntEnum):
+    HEALTHY = 0
+    WARNING = 1
+    CRITICAL = 2
+    UNKNOWN = 3
+
+
+class HealthStyle(NamedTuple):
+    emoji: str
+    color: str
+    label: str
+
+
+# Indexed by Health
+HEALTH_STATUS = (
+    HealthStyle("✅", "green", "Healthy"),
+    HealthStyle("⚠️", "orange", "Warning"),
+    HealthStyle("❌", "red", "Critical"),
+    HealthStyle("❓", "gray", "Unknown"),
+)
+
+
+def _freeze(table: dict) -> MappingProxyType:
+    """Read-only view of a two-level config table"""
+    return MappingProxyType({k: MappingProxyType(v) for k, v in table.items()})
+
+
+# Taxonomy and company definitions are read-only at runtime
+DAT_COMPANIES = _freeze(DAT_COMPANIES)
+SOL_DAT_COMPANIES = _freeze(SOL_DAT_COMPANIES)
+HYPE_DAT_COMPANIES = _freeze(HYPE_DAT_COMPANIES)
+BNB_DAT_COMPANIES = _freeze(BNB_DAT_COMPANIES)
+BTC_DAT_COMPANIES = _freeze(BTC_DAT_COMPANIES)
+PHASES = _freeze(PHASES)
+THESES = MappingProxyType(THESES)
+
+# Reverse indexes: layer -> thesis numbers, tier -> tickers (config order)
+THESES_BY_LAYER = MappingProxyType({
+    layer: tuple(num for num, thesis in THESES.items() if thesis.layer == layer)
+    for layer in LAYER_NAMES
+})
+DAT_BY_TIER = MappingProxyType({
+    tier: tuple(ticker for ticker, company in DAT_COMPANIES.items() if company["tier"] == tier)
+    for tier in sorted({company["tier"] for company in DAT_COMPANIES.values()})
+})
+
+# Column view of DAT_COMPANIES (one row per ticker) for aggregate math
+DAT_COMPANIES_DF = pd.DataFrame.from_dict(DAT_COMPANIES, orient="index")
@@ -16,6 +16,7 @@ from .fetchers import (
     fetch_dxy,
     fetch_all_dat_stocks,
     calculate_net_liquidity,
+    get_http_session,
 )
 
 from .calculations import (
@@ -4,6 +4,7 @@ NAV, ETH per share, drawdowns, phase detection, health status
 """
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
+from config import Health, Position
 
 
 def calculate_nav(eth_holdings: float, eth_price: float) -> float:
@@ -115,7 +116,7 @@ def calculate_position_value(
 
 
 def calculate_portfolio_metrics(
-    positions: Dict[str, Dict[str, Any]],
+    positions: Dict[str, Position],
     stock_data: Dict[str, Dict[str, Any]],
 ) -> Dict[str, Any]:
     """Calculate aggregate portfolio metrics"""
@@ -124,8 +125,8 @@ def calculate_portfolio_metrics(
     position_values = {}
 
     for ticker, position in positions.items():
-        shares = position.get("shares", 0)
-        cost_basis = position.get("cost_basis")
+        shares = position.shares or 0
+        cost_basis = position.cost_basis
 
         stock = stock_data.get(ticker, {})
         price = stock.get("price", 0) or 0
@@ -155,25 +156,25 @@ def get_health_status(
     warning_threshold: float,
     critical_threshold: float,
     higher_is_better: bool = True,
-) -> str:
+) -> Health:
     """
     Determine health status based on thresholds
-    Returns: 'healthy', 'warning', or 'critical'
+    Returns: Health.HEALTHY, Health.WARNING, or Health.CRITICAL
     """
     if higher_is_better:
         if value >= warning_threshold:
-            return "healthy"
+            return Health.HEALTHY
         elif value >= critical_threshold:
-            return "warning"
+            return Health.WARNING
         else:
-            return "critical"
+            return Health.CRITICAL
     else:
         if value <= warning_threshold:
-            return "healthy"
+            return Health.HEALTHY
         elif value <= critical_threshold:
-            return "warning"
+            return Health.WARNING
         else:
-            return "critical"
+            return Health.CRITICAL
 
 
 def check_precondition_health(
@@ -189,12 +190,7 @@ def check_precondition_health(
 
     # ETH Dominance (Thesis 4 precondition)
     if eth_dominance is not None:
-        if eth_dominance >= 0.50:
-            status = "healthy"
-        elif eth_dominance >= 0.40:
-            status = "warning"
-        else:
-            status = "critical"
+        status = get_health_status(eth_dominance, 0.50, 0.40)
         results["eth_dominance"] = {
             "value": eth_dominance,
             "status": status,
@@ -202,16 +198,11 @@ def check_precondition_health(
             "threshold": "Invalidation below 40% for 2+ years",
         }
     else:
-        results["eth_dominance"] = {"status": "unknown", "label": "Data unavailable"}
+        results["eth_dominance"] = {"status": Health.UNKNOWN, "label": "Data unavailable"}
 
     # ETH Staking Yield (Thesis 4 precondition)
     if eth_staking_apy is not None:
-        if eth_staking_apy >= 0.03:
-            status = "healthy"
-        elif eth_staking_apy >= 0.02:
-            status = "warning"
-        else:
-            status = "critical"
+        status = get_health_status(eth_staking_apy, 0.03, 0.02)
         results["eth_yield"] = {
             "value": eth_staking_apy,
             "status": status,
@@ -219,17 +210,17 @@ def check_precondition_health(
             "threshold": "Invalidation below 1% for 2+ years",
         }
     else:
-        results["eth_yield"] = {"status": "unknown", "label": "Data unavailable"}
+        results["eth_yield"] = {"status": Health.UNKNOWN, "label": "Data unavailable"}
 
     # Macro Backdrop (Thesis 1 precondition)
     if deficit_gdp_ratio is not None:
         # For fiscal dominance thesis, sustained deficits confirm the thesis
         if deficit_gdp_ratio < -3:  # Deficit (negative is deficit)
-            status = "healthy"  # Confirms fiscal dominance thesis
+            status = Health.HEALTHY  # Confirms fiscal dominance thesis
         elif deficit_gdp_ratio < 0:
-            status = "warning"
+            status = Health.WARNING
         else:
-            status = "critical"  # Surplus would refute thesis
+            status = Health.CRITICAL  # Surplus would refute thesis
         results["macro_backdrop"] = {
             "value": deficit_gdp_ratio,
             "status": status,
@@ -237,7 +228,7 @@ def check_precondition_health(
             "threshold": "Thesis confirmed by continued deficits",
         }
     else:
-        results["macro_backdrop"] = {"status": "unknown", "label": "Data unavailable"}
+        results["macro_backdrop"] = {"status": Health.UNKNOWN, "label": "Data unavailable"}
 
     return results
 
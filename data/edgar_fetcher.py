@@ -2,17 +2,25 @@
 SEC EDGAR data fetcher for DAT companies
 Fetches recent SEC filings (10-K, 10-Q, 8-K, etc.)
 """
-import requests
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
+
 import streamlit as st
 
+from .fetchers import get_http_session
+
 # SEC requires a User-Agent header with contact info
 HEADERS = {
     "User-Agent": "ThesisDashboard contact@example.com",
     "Accept-Encoding": "gzip, deflate",
 }
 
+# Concurrent requests to SEC (fair-access policy allows 10 requests/second)
+SEC_MAX_WORKERS = 8
+
 # CIK numbers for DAT companies (10-digit padded)
 DAT_COMPANY_CIKS = {
     "BMNR": "0001829311",  # Bitmine Immersion Technologies
@@ -25,8 +33,11 @@ DAT_COMPANY_CIKS = {
     "FGNX": "0001527352",  # Fundamental Global
 }
 
-# Filing types we care about
-RELEVANT_FILING_TYPES = [
+# CIK link in EDGAR's company atom feed
+CIK_PATTERN = re.compile(rb"cik=(\d+)", re.IGNORECASE)
+
+# Filing types we care about (a tuple, so str.startswith can match them all at once)
+RELEVANT_FILING_TYPES = (
     "10-K",      # Annual report
     "10-Q",      # Quarterly report
     "8-K",       # Current report (material events)
@@ -37,7 +48,21 @@ RELEVANT_FILING_TYPES = [
     "S-3",       # Shelf registration
     "424B",      # Prospectus
     "DEF 14A",   # Proxy statement
-]
+)
+
+# Human-readable descriptions, matched by prefix in order
+FILING_TYPE_DESCRIPTIONS = {
+    "10-K": "Annual Report",
+    "10-Q": "Quarterly Report",
+    "8-K": "Current Report (Material Event)",
+    "4": "Insider Trading Report",
+    "SC 13D": "Beneficial Ownership (>5%)",
+    "SC 13G": "Beneficial Ownership (Passive)",
+    "S-1": "IPO Registration",
+    "S-3": "Shelf Registration",
+    "424B": "Prospectus",
+    "DEF 14A": "Proxy Statement",
+}
 
 
 def lookup_cik_by_ticker(ticker: str) -> Optional[str]:
@@ -53,16 +78,13 @@ def lookup_cik_by_ticker(ticker: str) -> Optional[str]:
             "count": "1",
             "output": "atom",
         }
-        response = requests.get(url, params=params, headers=HEADERS, timeout=10)
+        response = get_http_session().get(url, params=params, headers=HEADERS, timeout=10)
 
         if response.status_code == 200:
-            # Parse the atom feed to extract CIK
-            content = response.text
-            if "cik=" in content.lower():
-                import re
-                match = re.search(r'cik=(\d+)', content.lower())
-                if match:
-                    return match.group(1).zfill(10)
+            # Parse the atom feed to extract CIK (raw bytes - no decode/lowercase copy)
+            match = CIK_PATTERN.search(response.content)
+            if match:
+                return match.group(1).decode("ascii").zfill(10)
         return None
     except Exception as e:
         return None
@@ -77,7 +99,7 @@ def fetch_company_filings(cik: str, count: int = 10) -> List[Dict[str, Any]]:
     try:
         # SEC EDGAR API endpoint
         url = f"https://data.sec.gov/submissions/CIK{cik}.json"
-        response = requests.get(url, headers=HEADERS, timeout=15)
+        response = get_http_session().get(url, headers=HEADERS, timeout=15)
         response.raise_for_status()
 
         data = response.json()
@@ -97,7 +119,7 @@ def fetch_company_filings(cik: str, count: int = 10) -> List[Dict[str, Any]]:
             form_type = forms[i] if i < len(forms) else ""
 
             # Filter to relevant filing types
-            if not any(form_type.startswith(ft) for ft in RELEVANT_FILING_TYPES):
+            if not form_type.startswith(RELEVANT_FILING_TYPES):
                 continue
 
             filing_date = filing_dates[i] if i < len(filing_dates) else ""
@@ -119,7 +141,7 @@ def fetch_company_filings(cik: str, count: int = 10) -> List[Dict[str, Any]]:
                 "company": company_name,
                 "form_type": form_type,
                 "filing_date": filing_date,
-                "date": parsed_date,
+                "date_key": parsed_date.year * 10000 + parsed_date.month * 100 + parsed_date.day,
                 "date_str": parsed_date.strftime("%b %d, %Y"),
                 "description": description or form_type,
                 "url": filing_url,
@@ -134,26 +156,32 @@ def fetch_company_filings(cik: str, count: int = 10) -> List[Dict[str, Any]]:
         return []
 
 
+def _fetch_ticker_filings(ticker: str, count: int) -> List[Dict[str, Any]]:
+    """Fetch recent filings for one DAT ticker, looking up its CIK if unknown"""
+    # Workers only read DAT_COMPANY_CIKS - looked-up CIKs aren't written back from threads
+    cik = DAT_COMPANY_CIKS.get(ticker) or lookup_cik_by_ticker(ticker)
+    if not cik:
+        return []
+
+    filings = fetch_company_filings(cik, count)
+    for filing in filings:
+        filing["ticker"] = ticker
+    return filings
+
+
 @st.cache_data(ttl=3600)
 def fetch_all_dat_filings(count_per_company: int = 5) -> List[Dict[str, Any]]:
     """Fetch recent SEC filings for all DAT companies"""
-    all_filings = []
-
-    for ticker, cik in DAT_COMPANY_CIKS.items():
-        if not cik:
-            # Try to look up CIK
-            cik = lookup_cik_by_ticker(ticker)
-            if cik:
-                DAT_COMPANY_CIKS[ticker] = cik
-
-        if cik:
-            filings = fetch_company_filings(cik, count_per_company)
-            for filing in filings:
-                filing["ticker"] = ticker
-            all_filings.extend(filings)
+    # Requests are I/O bound, so fetch companies concurrently
+    tickers = list(DAT_COMPANY_CIKS)
+    with ThreadPoolExecutor(max_workers=SEC_MAX_WORKERS) as executor:
+        results = executor.map(
+            _fetch_ticker_filings, tickers, [count_per_company] * len(tickers)
+        )
+        all_filings = [filing for filings in results for filing in filings]
 
-    # Sort by date (newest first)
-    all_filings.sort(key=lambda x: x.get("date", datetime.min), reverse=True)
+    # Sort by date (newest first) - date_key is an int YYYYMMDD
+    all_filings.sort(key=itemgetter("date_key"), reverse=True)
 
     return all_filings
 
@@ -180,20 +208,7 @@ def fetch_company_edgar(ticker: str, count: int = 10) -> List[Dict[str, Any]]:
 
 def get_filing_type_description(form_type: str) -> str:
     """Get human-readable description of filing type"""
-    descriptions = {
-        "10-K": "Annual Report",
-        "10-Q": "Quarterly Report",
-        "8-K": "Current Report (Material Event)",
-        "4": "Insider Trading Report",
-        "SC 13D": "Beneficial Ownership (>5%)",
-        "SC 13G": "Beneficial Ownership (Passive)",
-        "S-1": "IPO Registration",
-        "S-3": "Shelf Registration",
-        "424B": "Prospectus",
-        "DEF 14A": "Proxy Statement",
-    }
-
-    for key, desc in descriptions.items():
+    for key, desc in FILING_TYPE_DESCRIPTIONS.items():
         if form_type.startswith(key):
             return desc
 
@@ -3,14 +3,26 @@ Data fetching functions for various APIs
 CoinGecko, Yahoo Finance, FRED, DefiLlama
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yfinance as yf
 import pandas as pd
 import json
 import os
+import tempfile
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, List
 import streamlit as st
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
+from config import alpha_vantage_key, fmp_api_key
+
+# orjson is optional - stdlib json.loads accepts the same bytes payload
+try:
+    import orjson as json_parser
+except ImportError:
+    import json as json_parser
 
 # Cache timeout in seconds
 CACHE_TTL = 300  # 5 minutes
@@ -20,9 +32,36 @@ STOCK_CACHE_TTL = 900  # 15 minutes for stock data (reduce Yahoo API calls)
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
 
+# Connection pool sizing - enough per host for the concurrent ticker fan-out
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
 # Persistent cache file path
 STOCK_CACHE_FILE = os.path.join(os.path.dirname(__file__), "stock_cache.json")
 
+# Serializes read-modify-write of the cache file when tickers are fetched concurrently
+_stock_cache_lock = threading.Lock()
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Shared HTTP session - keeps connections alive across calls and reruns"""
+    session = requests.Session()
+    # Connect errors and 5xx responses get quick retries; read timeouts don't,
+    # since each would cost another full timeout
+    retries = Retry(
+        total=3, read=0, backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504), raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 def _load_stock_cache() -> Dict[str, Any]:
     """Load persistent stock cache from file"""
@@ -37,18 +76,31 @@ def _load_stock_cache() -> Dict[str, Any]:
 
 def _save_stock_cache(cache: Dict[str, Any]) -> None:
     """Save stock cache to file"""
+    # Write a temp file and swap it in, so concurrent readers never see a partial file
+    tmp_path = None
     try:
-        with open(STOCK_CACHE_FILE, "w") as f:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(STOCK_CACHE_FILE), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
             json.dump(cache, f, indent=2)
+        # mkstemp creates the file owner-only; keep the cache file's usual permissions
+        try:
+            mode = os.stat(STOCK_CACHE_FILE).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, STOCK_CACHE_FILE)
     except Exception:
-        pass  # Fail silently on Streamlit Cloud (read-only filesystem)
+        # Fail silently on Streamlit Cloud (read-only filesystem)
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 def _update_stock_cache(ticker: str, data: Dict[str, Any]) -> None:
     """Update a single ticker in the cache"""
-    cache = _load_stock_cache()
-    cache[ticker] = data
-    _save_stock_cache(cache)
+    with _stock_cache_lock:
+        cache = _load_stock_cache()
+        cache[ticker] = data
+        _save_stock_cache(cache)
 
 
 def _get_cached_stock(ticker: str) -> Optional[Dict[str, Any]]:
@@ -80,9 +132,9 @@ def fetch_eth_price() -> Dict[str, Any]:
             "include_24hr_change": "true",
             "include_market_cap": "true",
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = get_http_session().get(url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = json_parser.loads(response.content)
         return {
             "price": data["ethereum"]["usd"],
             "change_24h": data["ethereum"].get("usd_24h_change", 0),
@@ -98,9 +150,9 @@ def fetch_eth_treasury_companies() -> List[Dict[str, Any]]:
     """Fetch ETH treasury company data from CoinGecko"""
     try:
         url = "https://api.coingecko.com/api/v3/companies/public_treasury/ethereum"
-        response = requests.get(url, timeout=10)
+        response = get_http_session().get(url, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = json_parser.loads(response.content)
         return data.get("companies", [])
     except Exception as e:
         return []
@@ -122,7 +174,12 @@ def _fetch_from_yahoo(ticker: str) -> Optional[Dict[str, Any]]:
                 raise Exception("No price data")
 
             hist = stock.history(period="1y")
-            ath_1y = hist["High"].max() if not hist.empty else None
+            ath_1y = None
+            # Empty or column-less history (rate limit, new listing) keeps the live price
+            if not hist.empty and "High" in hist:
+                highs = hist["High"].dropna().to_numpy()
+                if highs.size:
+                    ath_1y = float(highs.max())
             drawdown = None
             if ath_1y and current_price:
                 drawdown = (current_price - ath_1y) / ath_1y
@@ -162,9 +219,9 @@ def _fetch_from_alpha_vantage(ticker: str, api_key: str) -> Optional[Dict[str, A
             "symbol": ticker,
             "apikey": api_key,
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = get_http_session().get(url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = json_parser.loads(response.content)
 
         # Check for rate limit or error
         if "Note" in data or "Error Message" in data:
@@ -206,9 +263,9 @@ def _fetch_from_fmp(ticker: str, api_key: str) -> Optional[Dict[str, Any]]:
     try:
         url = f"https://financialmodelingprep.com/api/v3/quote/{ticker}"
         params = {"apikey": api_key}
-        response = requests.get(url, params=params, timeout=10)
+        response = get_http_session().get(url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = json_parser.loads(response.content)
 
         if not data or isinstance(data, dict) and "Error" in str(data):
             return None
@@ -241,16 +298,15 @@ def _fetch_from_fmp(ticker: str, api_key: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-@st.cache_data(ttl=STOCK_CACHE_TTL)
+# No spinner: this runs in fetch_all_dat_stocks' worker threads, which have no script context
+@st.cache_data(ttl=STOCK_CACHE_TTL, show_spinner=False)
 def fetch_stock_data(ticker: str) -> Dict[str, Any]:
     """Fetch stock data with automatic fallback between sources and persistent cache"""
-    from config import ALPHA_VANTAGE_KEY, FMP_API_KEY
-
     # Try sources in order: Yahoo -> FMP -> Alpha Vantage
     sources = [
         ("yahoo", lambda: _fetch_from_yahoo(ticker)),
-        ("fmp", lambda: _fetch_from_fmp(ticker, FMP_API_KEY)),
-        ("alpha_vantage", lambda: _fetch_from_alpha_vantage(ticker, ALPHA_VANTAGE_KEY)),
+        ("fmp", lambda: _fetch_from_fmp(ticker, fmp_api_key())),
+        ("alpha_vantage", lambda: _fetch_from_alpha_vantage(ticker, alpha_vantage_key())),
     ]
 
     errors = []
@@ -307,7 +363,7 @@ def fetch_fred_series(series_id: str, api_key: str, limit: int = 100) -> pd.Data
             "sort_order": "desc",
             "limit": limit,
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = get_http_session().get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -382,33 +438,35 @@ def fetch_deficit_gdp_ratio(api_key: str) -> Dict[str, Any]:
     }
 
 
+# Ethereum L2s counted towards ETH ecosystem TVL (lowercase DefiLlama chain names)
+L2_CHAIN_NAMES = frozenset({
+    "arbitrum", "optimism", "base", "polygon", "zksync era", "linea", "scroll", "starknet",
+})
+
+
 @st.cache_data(ttl=CACHE_TTL)
 def fetch_defi_tvl() -> Dict[str, Any]:
     """Fetch DeFi TVL data from DefiLlama"""
     try:
         # Get all chains TVL
         url = "https://api.llama.fi/v2/chains"
-        response = requests.get(url, timeout=10)
+        response = get_http_session().get(url, timeout=10)
         response.raise_for_status()
         chains = response.json()
 
-        # Calculate ETH dominance
+        # Calculate ETH dominance, plus L2s TVL (Arbitrum, Optimism, Base, etc.)
         eth_tvl = 0
+        l2_tvl = 0
         total_tvl = 0
 
         for chain in chains:
             tvl = chain.get("tvl", 0)
             total_tvl += tvl
-            if chain.get("name", "").lower() == "ethereum":
+            name = chain.get("name", "").lower()
+            if name == "ethereum":
                 eth_tvl = tvl
-
-        # Get L2s TVL (Arbitrum, Optimism, Base, etc.)
-        l2_names = ["arbitrum", "optimism", "base", "polygon", "zksync era", "linea", "scroll", "starknet"]
-        l2_tvl = sum(
-            chain.get("tvl", 0)
-            for chain in chains
-            if chain.get("name", "").lower() in l2_names
-        )
+            elif name in L2_CHAIN_NAMES:
+                l2_tvl += tvl
 
         eth_ecosystem_tvl = eth_tvl + l2_tvl
         dominance = eth_ecosystem_tvl / total_tvl if total_tvl > 0 else 0
@@ -432,7 +490,7 @@ def fetch_eth_staking_stats() -> Dict[str, Any]:
         # Try beaconcha.in API first for accurate staking APR
         try:
             url = "https://beaconcha.in/api/v1/ethstore/latest"
-            response = requests.get(url, timeout=10)
+            response = get_http_session().get(url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if data.get("status") == "OK":
@@ -447,7 +505,7 @@ def fetch_eth_staking_stats() -> Dict[str, Any]:
 
         # Fallback: Using DefiLlama for Lido data
         url = "https://api.llama.fi/protocol/lido"
-        response = requests.get(url, timeout=10)
+        response = get_http_session().get(url, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -473,7 +531,7 @@ def fetch_eth_burn_stats() -> Dict[str, Any]:
     try:
         # ultrasound.money API endpoint
         url = "https://ultrasound.money/api/v2/fees/eth-burn-total"
-        response = requests.get(url, timeout=10)
+        response = get_http_session().get(url, timeout=10)
 
         if response.status_code == 200:
             data = response.json()
@@ -510,7 +568,7 @@ def fetch_eth_supply_stats() -> Dict[str, Any]:
     try:
         # Try ultrasound.money for supply data
         url = "https://ultrasound.money/api/v2/fees/supply-parts"
-        response = requests.get(url, timeout=10)
+        response = get_http_session().get(url, timeout=10)
 
         if response.status_code == 200:
             data = response.json()
@@ -547,10 +605,11 @@ def fetch_dxy() -> Dict[str, Any]:
     """Fetch DXY (Dollar Index) from Yahoo Finance"""
     try:
         dxy = yf.Ticker("DX-Y.NYB")
-        info = dxy.info
         hist = dxy.history(period="5d")
 
-        current = hist["Close"].iloc[-1] if not hist.empty else None
+        current = None
+        if not hist.empty and "Close" in hist:
+            current = float(hist["Close"].to_numpy()[-1])
 
         return {
             "value": current,
@@ -560,12 +619,25 @@ def fetch_dxy() -> Dict[str, Any]:
         return {"error": str(e), "value": None}
 
 
-def fetch_all_dat_stocks(tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+def fetch_all_dat_stocks(tickers: Iterable[str]) -> Dict[str, Dict[str, Any]]:
     """Fetch stock data for all DAT companies"""
+    tickers = list(tickers)
+    if not tickers:
+        return {}
+
+    # Each fetch blocks on network I/O, so run them concurrently
     results = {}
-    for ticker in tickers:
-        results[ticker] = fetch_stock_data(ticker)
-    return results
+    with ThreadPoolExecutor(max_workers=min(16, len(tickers))) as executor:
+        futures = {executor.submit(fetch_stock_data, ticker): ticker for ticker in tickers}
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                results[ticker] = future.result()
+            except Exception as e:
+                results[ticker] = {"ticker": ticker, "error": str(e), "price": None}
+
+    # Keep the caller's ticker order
+    return {ticker: results[ticker] for ticker in tickers}
 
 
 def calculate_net_liquidity(fed_bs: float, tga: float, rrp: float) -> float:
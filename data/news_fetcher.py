@@ -2,14 +2,16 @@
 News fetcher for DAT company updates
 Aggregates news from multiple crypto news sources
 """
-import requests
 import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from email.utils import parsedate_to_datetime
+
 import streamlit as st
 from bs4 import BeautifulSoup
 
+from .fetchers import get_http_session
+
 
 def parse_rss_date(date_str: str) -> datetime:
     """Parse RSS date string robustly"""
@@ -75,7 +77,7 @@ def fetch_google_news(query: str, num_results: int = 10) -> List[Dict[str, Any]]
     """Fetch news from Google News RSS"""
     try:
         url = f"https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
-        response = requests.get(url, timeout=10)
+        response = get_http_session().get(url, timeout=10)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, 'xml')
@@ -109,7 +111,7 @@ def fetch_coindesk_news() -> List[Dict[str, Any]]:
     """Fetch latest news from CoinDesk RSS"""
     try:
         url = "https://www.coindesk.com/arc/outboundfeeds/rss/"
-        response = requests.get(url, timeout=10)
+        response = get_http_session().get(url, timeout=10)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, 'xml')
@@ -158,7 +160,7 @@ def fetch_cointelegraph_news() -> List[Dict[str, Any]]:
     """Fetch news from Cointelegraph RSS"""
     try:
         url = "https://cointelegraph.com/rss"
-        response = requests.get(url, timeout=10)
+        response = get_http_session().get(url, timeout=10)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, 'xml')
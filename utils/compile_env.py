@@ -0,0 +1,46 @@
+"""
+Compile .env into a Python module
+
+Writes env_compiled.py next to config.py so the app can load settings from
+the bytecode cache instead of parsing .env with python-dotenv on every start.
+Re-run after editing .env.
+
+Usage:
+    python -m utils.compile_env
+"""
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+ROOT = Path(__file__).parent.parent
+ENV_FILE = ROOT / ".env"
+OUTPUT_FILE = ROOT / "env_compiled.py"
+
+
+def compile_env(env_file: Path = ENV_FILE, output_file: Path = OUTPUT_FILE) -> int:
+    """Write env_compiled.py from a .env file, returning the number of keys"""
+    values = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+
+    lines = [
+        '"""Generated from .env by utils/compile_env.py - do not edit"""',
+        "import os",
+        "",
+    ]
+    # setdefault keeps real environment variables winning, as load_dotenv does
+    lines += [f"os.environ.setdefault({k!r}, {v!r})" for k, v in values.items()]
+
+    output_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return len(values)
+
+
+def main():
+    if not ENV_FILE.exists():
+        print(f"No .env file found at {ENV_FILE}")
+        return
+
+    count = compile_env()
+    print(f"Wrote {count} keys to {OUTPUT_FILE.name}")
+
+
+if __name__ == "__main__":
+    main()
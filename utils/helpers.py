@@ -1,13 +1,16 @@
 """
 Utility functions and helpers
 """
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import date, datetime, timedelta
+from typing import Optional, Union
 
 
-def days_until(date_str: str) -> int:
-    """Calculate days until a future date"""
-    target = datetime.strptime(date_str, "%Y-%m-%d")
+def days_until(target_date: Union[date, str]) -> int:
+    """Calculate days until a future date (date object or YYYY-MM-DD string)"""
+    if isinstance(target_date, str):
+        target = datetime.strptime(target_date, "%Y-%m-%d")
+    else:
+        target = datetime.combine(target_date, datetime.min.time())
     today = datetime.now()
     delta = target - today
     return max(0, delta.days)